@@ -12,6 +12,7 @@ class ScrollablePage(Page):
         parent = super().frame  # the Page full frame
 
         canvas = tk.Canvas(parent, borderwidth=0)
+        self.__canvas = canvas
 
         def _yview(*args: Any) -> None:
             canvas.yview(*args) # type: ignore
@@ -167,4 +168,13 @@ class ScrollablePage(Page):
     @property
     def frame(self):
         """Return the inner scrollable frame so callers draw into it."""
-        return self.__scrollable_frame
\ No newline at end of file
+        return self.__scrollable_frame
+
+    def see(self, widget: tk.Misc) -> None:
+        """Scrolls so that widget, drawn in the scrollable frame, is at the top of the visible area."""
+        self.__canvas.update_idletasks()
+        height = self.__scrollable_frame.winfo_height()
+        if height <= 0:
+            return
+        top = widget.winfo_rooty() - self.__scrollable_frame.winfo_rooty()
+        self.__canvas.yview_moveto(max(0.0, min(top / height, 1.0)))
\ No newline at end of file
@@ -1,39 +1,54 @@
 """Manages the question GUI page."""
 
 from abc import ABC, abstractmethod
+from math import fsum
 
 import tkinter as tk
 
 from tkinter import Misc, ttk
-from typing import Callable
+from typing import Callable, Sequence
 
 from guilib import PADDING
 from guilib.pages import Page
 
+from lib.sampler import WeightedSampler, batch_weights
+from lib.scheduler import SpacedScheduler
+
 INSISTENCE = 2.0
 
+# Whether the next question is pulled and drawn off-screen while the current one is shown
+PREFETCH = True
+
+# How the next question is chosen: "weighted" draws it at random according to the weights,
+# "spaced" takes the one due first according to a spaced repetition schedule.
+SCHEDULER = "weighted"
+
+# Number of incremental progress updates after which the aggregates are recomputed exactly
+PROGRESS_RECOMPUTE_PERIOD = 1000
+
 class CallOnce:
     """Utility class to ensure a callable is only called once."""
-    def __init__(self, func: Callable[[], None]):
+    def __init__(self, func: Callable[..., None]):
         self._func = func
         self._called = False
 
-    def __call__(self) -> None:
+    def __call__(self, *args) -> None:
         if not self._called:
-            self._func()
+            self._func(*args)
             self._called = True
 
 class QuestionDrawer(ABC):
     """
     A page that displays a question to the user.
 
-    When the user answers the question, the `on_answered` callback is called.
+    When the user answers the question, the `on_answered` callback is called with whether the answer was correct.
     When the question is deleted, the `on_deleted` callback is called. This ensures the question is not displayed anymore.
     """
     @abstractmethod
-    def draw(self, root: Misc, on_answered: CallOnce) -> None:
+    def draw(self, root: Misc, on_answered: CallOnce, on_deleted: CallOnce) -> None:
         """Draws the question on the given root widget. 
-        When the question is answered, the `on_answered` callback should be called, and the probability updated (and saved).
+        When the question is answered, the probability should be updated (and saved), and the `on_answered` callback
+        called with whether the answer was correct.
         When the question is deleted, the `on_deleted` callback should be called. This ensures the question is not displayed anymore.
         
         Resulting frame must not be influenced by other calls."""
@@ -47,6 +62,16 @@ class QuestionDrawer(ABC):
     def get_average(self) -> float:
         """Returns the average score as a float between 0 and 1."""
         ...
+    @abstractmethod
+    def get_streak(self) -> int:
+        """Returns the number of correct answers in a row."""
+        ...
+
+    @classmethod
+    def get_columns(cls, drawers: Sequence["QuestionDrawer"]) -> tuple[Sequence[float], Sequence[float]]:
+        """Returns the probabilities and the averages of all the given drawers, which are instances of cls.
+        Override to fetch them in bulk."""
+        return [drawer.get_probability() for drawer in drawers], [drawer.get_average() for drawer in drawers]
 
 class QuestionnerPage(Page):
     """A page that shows questions to the user.
@@ -56,11 +81,17 @@ class QuestionnerPage(Page):
         super().__init__(root, sticky)
 
         self.__question_list = question_list
-        self.__deleted_questions: set[int] = set()
         self.__empty_callback = empty_callback
         self.progress_var = tk.DoubleVar(value=0.0)
+        # Questions whose weight may have changed since they were last drawn
+        self.__drawn_indices: list[int] = []
+        self._build_pool()
         
         self._curr_question_frame: ttk.Frame | None = None
+        self._prev_question_frame: ttk.Frame | None = None
+        # Next question, with its weight when it was pulled and its off-screen frame
+        self.__prefetched: tuple[int, float, ttk.Frame] | None = None
+        self.__prefetch_job: str | None = None
 
         separator = ttk.Separator(self.frame, orient="horizontal")
 
@@ -77,51 +108,183 @@ class QuestionnerPage(Page):
             if self.__empty_callback is not None:
                 self.__empty_callback()
 
-    def _pull_question(self) -> QuestionDrawer:
-        """Pulls a question from the weighted question list."""
+    def _question_weight(self, idx: int) -> float:
+        """Returns the sampling weight of the question at idx."""
+        return self.__question_list[idx].get_probability() ** INSISTENCE
 
-        from random import choices
+    def _build_pool(self):
+        """Builds the weighted sampler and the progress aggregates over the whole question list."""
+        question_list = self.__question_list
 
-        weights = [question.get_probability() ** INSISTENCE for question in self.__question_list]
+        # Bulk fetch when every drawer has the same type, which allows vectorized computations
+        drawer_type = type(question_list[0]) if len(question_list) > 0 else QuestionDrawer
+        if not all(type(question) is drawer_type for question in question_list):
+            drawer_type = QuestionDrawer
+        probabilities, averages = drawer_type.get_columns(question_list)
 
-        print("Pulling one from", len(self.__question_list), "questions")
+        weights, self.__numer_terms = batch_weights(probabilities, averages, INSISTENCE)
+        self.__sampler = WeightedSampler(weights)
+        self._recompute_progress()
 
-        sum_denom = sum(weights)
-        sum_numer = sum([question.get_probability() ** INSISTENCE * question.get_average() for question in self.__question_list])
+        # The sampler still tracks the weights and removals when questions are scheduled
+        if SCHEDULER == "spaced":
+            self.__scheduler = SpacedScheduler(question.get_streak() for question in question_list)
+        else:
+            self.__scheduler = None
+
+    def _recompute_progress(self):
+        """Recomputes the progress aggregates exactly, getting rid of accumulated float drift."""
+        self.__sampler.rebuild()
+        self.__sum_denom = self.__sampler.exact_total()
+        self.__sum_numer = fsum(self.__numer_terms)
+        self.__updates_since_recompute = 0
+
+    def _refresh_question(self, idx: int):
+        """Updates the weight and progress terms of the question at idx, in O(log n)."""
+        if self.__sampler.is_removed(idx):
+            return
 
-        self.progress_var.set(0.0 if sum_denom == 0 else sum_numer / sum_denom)
+        question = self.__question_list[idx]
+        weight = self._question_weight(idx)
+        numer_term = weight * question.get_average()
 
-        while True:
-            idx, selected_question = choices(list(enumerate(self.__question_list)), weights=weights, k=1)[0]
-            if idx not in self.__deleted_questions:
-                break
+        self.__sum_denom += weight - self.__sampler.weight(idx)
+        self.__sum_numer += numer_term - self.__numer_terms[idx]
+        self.__numer_terms[idx] = numer_term
+        self.__sampler.update(idx, weight)
 
-        return selected_question
+        self.__updates_since_recompute += 1
+        if self.__updates_since_recompute >= PROGRESS_RECOMPUTE_PERIOD:
+            self._recompute_progress()
+
+    def remove_question(self, idx: int):
+        """Removes the question at idx from the pool, so it is never shown again."""
+        if self.__sampler.is_removed(idx):
+            return
+
+        self.__sum_denom -= self.__sampler.weight(idx)
+        self.__sum_numer -= self.__numer_terms[idx]
+        self.__numer_terms[idx] = 0.0
+        self.__sampler.remove(idx)
+        if self.__scheduler is not None:
+            self.__scheduler.remove(idx)
+
+        if self.__prefetched is not None and self.__prefetched[0] == idx:
+            self._discard_prefetched()
+
+    def _refresh_pool(self):
+        """Refreshes the weights of the recently drawn questions and the progress."""
+
+        # Only the recently drawn questions can have been answered or edited
+        for idx in self.__drawn_indices:
+            self._refresh_question(idx)
+
+        sum_denom = self.__sum_denom
+        self.progress_var.set(0.0 if sum_denom <= 0 else self.__sum_numer / sum_denom)
+
+    def _pull_question(self) -> tuple[int, QuestionDrawer]:
+        """Pulls a question from the weighted question list, with its index."""
+        if self.__scheduler is not None:
+            idx = self.__scheduler.pop()
+        else:
+            idx = self.__sampler.draw()
+        return idx, self.__question_list[idx]
+
+    def _draw_question_frame(self, idx: int) -> ttk.Frame:
+        """Draws the question at idx in a new frame, which is not gridded yet."""
+        frame = ttk.Frame(self.frame)
+        self.__question_list[idx].draw(
+            frame,
+            on_answered=CallOnce(lambda correct: self._on_answered(idx, correct)),
+            on_deleted=CallOnce(lambda: self.remove_question(idx))
+        )
+        return frame
+
+    def _prefetch(self):
+        """Pulls the next question and draws it off-screen, while the current one is being answered."""
+        self.__prefetch_job = None
+        if self.__prefetched is not None or len(self.__sampler) == 0:
+            return
+
+        try:
+            idx, _ = self._pull_question()
+        except ValueError:
+            # Every scheduled question is checked out, the current one included
+            return
+        weight = self._question_weight(idx)
+        self.__prefetched = (idx, weight, self._draw_question_frame(idx))
+
+    def _discard_prefetched(self):
+        """Discards the prefetched question, if any."""
+        if self.__prefetch_job is not None:
+            self.frame.after_cancel(self.__prefetch_job)
+            self.__prefetch_job = None
+        if self.__prefetched is not None:
+            idx, _, frame = self.__prefetched
+            frame.destroy()
+            if self.__scheduler is not None:
+                self.__scheduler.requeue(idx)
+            self.__prefetched = None
+
+    def _take_prefetched(self) -> tuple[int, ttk.Frame] | None:
+        """Returns the prefetched question and its frame, unless its weight changed since it was pulled."""
+        prefetched = self.__prefetched
+        if prefetched is None:
+            return None
+
+        idx, weight, frame = prefetched
+        if self.__sampler.is_removed(idx) or self._question_weight(idx) != weight:
+            self._discard_prefetched()
+            return None
+
+        self.__prefetched = None
+        return idx, frame
+
+    def _on_answered(self, idx: int, correct: bool):
+        """Reschedules the question at idx after it was answered, and changes to the next one."""
+        if self.__scheduler is not None and not self.__sampler.is_removed(idx):
+            self.__scheduler.record(idx, correct)
+        self._change_question()
 
     def _change_question(self):
         """Changes the current question to a new one."""
+
+        if self.__prefetch_job is not None:
+            self.frame.after_cancel(self.__prefetch_job)
+            self.__prefetch_job = None
         
-        if len(self.__deleted_questions) == len(self.__question_list):
+        if len(self.__sampler) == 0:
+            self._discard_prefetched()
             if self.__empty_callback is not None:
                 self.__empty_callback()
             return
 
+        self._refresh_pool()
+
         # Update current question
-        question_drawer = self._pull_question()
+        prefetched = self._take_prefetched()
+        if prefetched is not None:
+            idx, frame = prefetched
+        else:
+            idx, _ = self._pull_question()
+            frame = self._draw_question_frame(idx)
 
-        # Regrid current question frame
+        # Keep the current and previous questions, which can still be edited
+        self.__drawn_indices = self.__drawn_indices[-1:] + [idx]
+
+        # Regrid current question frame, dropping the one it replaces
+        if self._prev_question_frame is not None:
+            self._prev_question_frame.destroy()
         if self._curr_question_frame is not None:
             self._curr_question_frame.grid(column=0, row=0, sticky="NSEW")
+        self._prev_question_frame = self._curr_question_frame
 
-        frame = ttk.Frame(self.frame)
         self._curr_question_frame = frame
-
         frame.grid(column=0, row=2, sticky="NSEW")
 
+        if PREFETCH:
+            self.__prefetch_job = self.frame.after_idle(self._prefetch)
 
-        question_drawer.draw(frame, on_answered=CallOnce(self._change_question))
-
-    
     @property
     def question_list(self) -> list[QuestionDrawer]:
         """The list of questions."""
@@ -131,13 +294,19 @@ class QuestionnerPage(Page):
     def question_list(self, new_list: list[QuestionDrawer]) -> None:
         """Sets the list of questions, and resets the display"""
         
+        self._discard_prefetched()
+
         self.__question_list = new_list
+        self.__drawn_indices = []
+        self._build_pool()
         
         if self._curr_question_frame is not None:
             self._curr_question_frame.destroy()
             self._curr_question_frame = None
+        if self._prev_question_frame is not None:
+            self._prev_question_frame.destroy()
+            self._prev_question_frame = None
         
-        self.__deleted_questions.clear()
         self._change_question()
 
 
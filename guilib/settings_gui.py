@@ -8,6 +8,18 @@ from guilib.pages import *
 
 from lib.settings import *
 
+# Labels of the question schedulers, by setting value
+_SCHEDULER_LABELS = {
+    "weighted": "Weighted random",
+    "spaced": "Spaced repetition",
+}
+
+# Labels of the storages of vocabulary sets, by setting value
+_STORAGE_LABELS = {
+    "files": "Separate files",
+    "sqlite": "Single database",
+}
+
 def load_settings() -> Settings:
     """Loads and applies the settings from the settings file."""
     settings = Settings.load()
@@ -114,6 +126,107 @@ def _draw_settings_frame(parent: tk.Misc, settings: Settings):
 
     insistence_exponent_spinbox.config(command=on_insistence_exponent_changed)
 
+    # Prefetch toggle
+    prefetch_var = tk.BooleanVar(value=settings.prefetch)
+
+    def on_prefetch_changed():
+        prefetch = prefetch_var.get()
+        _apply_prefetch(prefetch)
+        settings.edit_prefetch(prefetch)
+
+    prefetch_checkbutton = ttk.Checkbutton(parent, text="Prepare next question while answering", variable=prefetch_var, command=on_prefetch_changed)
+    prefetch_checkbutton.grid(column=0, row=7, pady=PADDING)
+
+    # Scheduler selection
+    ttk.Label(parent, text="Select Question Order:").grid(column=0, row=8, pady=PADDING)
+    scheduler_combobox = ttk.Combobox(parent, values=list(_SCHEDULER_LABELS.values()), state="readonly")
+    scheduler_combobox.grid(column=0, row=9, pady=PADDING)
+    scheduler_combobox.set(_SCHEDULER_LABELS.get(settings.scheduler, _SCHEDULER_LABELS["weighted"]))
+
+    def on_scheduler_selected(event: tk.Event):
+        label = scheduler_combobox.get()
+        for scheduler, scheduler_label in _SCHEDULER_LABELS.items():
+            if scheduler_label == label:
+                _apply_scheduler(scheduler)
+                settings.edit_scheduler(scheduler)
+
+    scheduler_combobox.bind("<<ComboboxSelected>>", on_scheduler_selected)
+
+    # Score file mapping toggle
+    map_score_files_var = tk.BooleanVar(value=settings.map_score_files)
+
+    def on_map_score_files_changed():
+        map_score_files = map_score_files_var.get()
+        _apply_map_score_files(map_score_files)
+        settings.edit_map_score_files(map_score_files)
+
+    map_score_files_checkbutton = ttk.Checkbutton(parent, text="Write answers in place in the score files", variable=map_score_files_var, command=on_map_score_files_changed)
+    map_score_files_checkbutton.grid(column=0, row=10, pady=PADDING)
+
+    # Storage selection, only used by the sets loaded after a restart
+    ttk.Label(parent, text="Select Storage (on restart):").grid(column=0, row=11, pady=PADDING)
+    storage_combobox = ttk.Combobox(parent, values=list(_STORAGE_LABELS.values()), state="readonly")
+    storage_combobox.grid(column=0, row=12, pady=PADDING)
+    storage_combobox.set(_STORAGE_LABELS.get(settings.storage, _STORAGE_LABELS["files"]))
+
+    def on_storage_selected(event: tk.Event):
+        label = storage_combobox.get()
+        for storage, storage_label in _STORAGE_LABELS.items():
+            if storage_label == label:
+                _apply_storage(storage)
+                settings.edit_storage(storage)
+
+    storage_combobox.bind("<<ComboboxSelected>>", on_storage_selected)
+
+    # Answer comparison toggles
+    fold_spelling_var = tk.BooleanVar(value=settings.fold_spelling)
+
+    def on_fold_spelling_changed():
+        fold_spelling = fold_spelling_var.get()
+        _apply_fold_spelling(fold_spelling)
+        settings.edit_fold_spelling(fold_spelling)
+
+    fold_spelling_checkbutton = ttk.Checkbutton(parent, text="Accept ss for ß and ae, oe, ue for ä, ö, ü", variable=fold_spelling_var, command=on_fold_spelling_changed)
+    fold_spelling_checkbutton.grid(column=0, row=13, pady=PADDING)
+
+    strip_articles_var = tk.BooleanVar(value=settings.strip_articles)
+
+    def on_strip_articles_changed():
+        strip_articles = strip_articles_var.get()
+        _apply_strip_articles(strip_articles)
+        settings.edit_strip_articles(strip_articles)
+
+    strip_articles_checkbutton = ttk.Checkbutton(parent, text="Accept answers without their article", variable=strip_articles_var, command=on_strip_articles_changed)
+    strip_articles_checkbutton.grid(column=0, row=14, pady=PADDING)
+
+    # Typo tolerance selection
+    ttk.Label(parent, text="Select Typo Tolerance:").grid(column=0, row=15, pady=PADDING)
+    typo_tolerance_spinbox = tk.Spinbox(parent, from_=0, to=5, increment=1, width=5)
+    typo_tolerance_spinbox.grid(column=0, row=16, pady=PADDING)
+    typo_tolerance_spinbox.delete(0, tk.END)  # type: ignore
+    typo_tolerance_spinbox.insert(0, str(settings.typo_tolerance))
+
+    def on_typo_tolerance_changed():
+        try:
+            tolerance = int(typo_tolerance_spinbox.get())
+            _apply_typo_tolerance(tolerance)
+            settings.edit_typo_tolerance(tolerance)
+        except ValueError:
+            pass
+
+    typo_tolerance_spinbox.config(command=on_typo_tolerance_changed)
+
+    # Live feedback toggle
+    live_feedback_var = tk.BooleanVar(value=settings.live_feedback)
+
+    def on_live_feedback_changed():
+        live_feedback = live_feedback_var.get()
+        _apply_live_feedback(live_feedback)
+        settings.edit_live_feedback(live_feedback)
+
+    live_feedback_checkbutton = ttk.Checkbutton(parent, text="Check answers while typing", variable=live_feedback_var, command=on_live_feedback_changed)
+    live_feedback_checkbutton.grid(column=0, row=17, pady=PADDING)
+
     return parent
 
 
@@ -135,8 +248,64 @@ def _apply_insistence_exponent(exponent: float):
 
     question_gui.INSISTENCE = exponent
 
+def _apply_prefetch(prefetch: bool):
+    """Applies the given prefetch setting to the application."""
+    import guilib.question_gui as question_gui
+
+    question_gui.PREFETCH = prefetch
+
+def _apply_scheduler(scheduler: str):
+    """Applies the given question scheduler to the application."""
+    import guilib.question_gui as question_gui
+
+    question_gui.SCHEDULER = scheduler
+
+def _apply_map_score_files(map_score_files: bool):
+    """Applies the given score file mapping setting to the application."""
+    import lib.score as score
+
+    score.MAP_SCORE_FILES = map_score_files
+
+def _apply_storage(storage: str):
+    """Applies the given storage of vocabulary sets to the application."""
+    import lib.vocabulary as vocabulary
+
+    vocabulary.STORAGE = storage
+
+def _apply_fold_spelling(fold_spelling: bool):
+    """Applies the given spelling folding setting to the application."""
+    import lib.normalization as normalization
+
+    normalization.FOLD_SPELLING = fold_spelling
+
+def _apply_strip_articles(strip_articles: bool):
+    """Applies the given article stripping setting to the application."""
+    import lib.normalization as normalization
+
+    normalization.STRIP_ARTICLES = strip_articles
+
+def _apply_typo_tolerance(tolerance: int):
+    """Applies the given typo tolerance to the application."""
+    import lib.fuzzy as fuzzy
+
+    fuzzy.TYPO_TOLERANCE = tolerance
+
+def _apply_live_feedback(live_feedback: bool):
+    """Applies the given live feedback setting to the application."""
+    import guilib.vocabulary_gui as vocabulary_gui
+
+    vocabulary_gui.LIVE_FEEDBACK = live_feedback
+
 def apply_settings(settings: Settings):
     """Applies the given settings to the application."""
     _apply_theme(settings.theme)
     _apply_score_exponent(settings.score_exponent)
-    _apply_insistence_exponent(settings.insistence_exponent)
\ No newline at end of file
+    _apply_insistence_exponent(settings.insistence_exponent)
+    _apply_prefetch(settings.prefetch)
+    _apply_scheduler(settings.scheduler)
+    _apply_map_score_files(settings.map_score_files)
+    _apply_storage(settings.storage)
+    _apply_fold_spelling(settings.fold_spelling)
+    _apply_strip_articles(settings.strip_articles)
+    _apply_typo_tolerance(settings.typo_tolerance)
+    _apply_live_feedback(settings.live_feedback)
\ No newline at end of file
@@ -1,9 +1,8 @@
-import re
 import tkinter as tk
 from tkinter import ttk
 import tkinter.messagebox as tkmsgbox
 
-from typing import Callable, Generic, TypeVar, Any
+from typing import Callable, Generic, Sequence, TypeVar, Any, cast
 
 from guilib import PADDING
 from guilib import selection_buttons
@@ -14,17 +13,37 @@ from guilib.question_gui import CallOnce, QuestionDrawer as QD, ToQuestionDrawer
 
 from tree import Path as TreePath
 
+import lib.fuzzy as fuzzy
 import lib.vocabulary as lvoc
+from lib.normalization import normalize, normalize_prefix
+from lib.question_index import QuestionIndex
+from lib.search import SearchIndex
+from lib.persistence import SaveQueue
+from lib.score import SCORE_CAP, gather_averages
 
 _HP = TypeVar("_HP", bound=HeaderedPage[Any], covariant=True)
 
 _DELETE_BUTTON_WIDTH = 2
 
-def natural_key(s: str):
-    return [
-        int(part) if part.isdigit() else part.lower()
-        for part in re.split(r'(\d+)', s)
-    ]
+# Interval in milliseconds at which errors of background saves are checked for
+_SAVE_ERROR_POLL_MS = 500
+
+# Number of search results visible at once
+_SEARCH_RESULT_LINES = 8
+
+# Whether the answer being typed is checked at each keystroke
+LIVE_FEEDBACK = False
+
+# Saves the question sets in the background
+SAVE_QUEUE = SaveQueue()
+
+def request_save(qset: lvoc.QuestionSet):
+    """Requests the set to be saved in the background. Raises ValueError if it can not be saved under its name."""
+    qset.check_name()
+    SAVE_QUEUE.request(qset, qset.save)
+
+def _summary_text(summary: lvoc.SetSummary) -> str:
+    return f"{summary.count} questions, {summary.mastery:.0%}"
 
 class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.TreeSubPage[_HP]], Generic[_HP], ToQuestionDrawer):
     """A page to select the vocabulary questions sets."""
@@ -50,6 +69,12 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         self.__selected: set[TreePath] = set()
 
         self.__buttons: dict[TreePath, list[tk.Misc]] = {}
+        self.__summary_labels: dict[TreePath, ttk.Label] = {}
+        # Opens the edit page of a set, scrolled to a row if one is given
+        self.__edit_callbacks: dict[TreePath, Callable[[int | None], None]] = {}
+
+        # Loaded on the first search
+        self.__search_index: SearchIndex | None = None
 
         # Register vocabulary section in the selection state
         self._path = selection_state.add_node(parent_path)
@@ -59,10 +84,11 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         page = menu_treer.create_subpage(parent, sticky=sticky, back=back, home=home)
 
         frame = page.frame
+        self.__poll_save_errors(frame)
 
-        # Load the sets
+        # Load the sets, new sets are kept in the same storage
+        self.__storage = lvoc.STORAGE
         question_sets = lvoc.QuestionSet.load_all()
-        question_sets.sort(key=lambda qs: natural_key(qs.name))
 
         # Register each set in the selection state
         self.sets: dict[TreePath, lvoc.QuestionSet] = {}
@@ -71,13 +97,15 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         frame.columnconfigure(0, weight=1)
         ttk.Label(frame, text="Vocabulary Sets:").grid(column=0, row=0, pady=PADDING)
 
+        self.__draw_search(frame).grid(column=0, row=1, sticky="EW", padx=PADDING)
+
         # Scrollable frame for the buttons
         
         scrollable_frame_area = ttk.Frame(frame)
 
-        scrollable_frame_area.grid(column=0, row=1, sticky="NSEW")
+        scrollable_frame_area.grid(column=0, row=2, sticky="NSEW")
 
-        frame.rowconfigure(1, weight=1)
+        frame.rowconfigure(2, weight=1)
 
 
         scrollbar_page = ScrollablePage(scrollable_frame_area)
@@ -87,6 +115,8 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
 
         self.__buttons_frame = ttk.Frame(scrollable_frame)
         self.__buttons_frame.grid(column=0, row=0)
+        # Scores and questions may have changed while the page was hidden
+        self.__buttons_frame.bind("<Map>", lambda e: (self.refresh_summaries(), self.__refresh_search_index()))
 
         scrollable_frame.columnconfigure(0, weight=1)
 
@@ -99,7 +129,7 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         def add_set_callback() -> None:
             self.add_new_set()
         add_set_button = ttk.Button(frame, text="Add New Set", command=add_set_callback)
-        add_set_button.grid(column=0, row=2, pady=PADDING)
+        add_set_button.grid(column=0, row=3, pady=PADDING)
 
         page_with_select_all = selection_buttons.HeaderedWithSelectAll(
             page,
@@ -109,6 +139,76 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
 
         self.__dict__.update(page_with_select_all.__dict__)
 
+    def __draw_search(self, parent: tk.Misc) -> ttk.Frame:
+        """Draws a search box over the questions of all sets, listing the matching questions below it."""
+        search_frame = ttk.Frame(parent)
+        search_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(search_frame, text="Search:").grid(column=0, row=0, sticky="W")
+        query_var = tk.StringVar()
+        ttk.Entry(search_frame, textvariable=query_var).grid(column=1, row=0, sticky="EW", padx=PADDING, pady=PADDING)
+
+        results = tk.Listbox(search_frame, height=_SEARCH_RESULT_LINES, activestyle="none")
+        hits: list[tuple[TreePath, int]] = []
+
+        def on_query_changed():
+            results.delete(0, tk.END)
+            hits.clear()
+            query = query_var.get()
+            if not query.strip():
+                results.grid_remove()
+                return
+
+            paths = {qset.name: path for path, qset in self.sets.items()}
+            found = [hit for hit in self.__get_search_index().search(query) if hit.set_name in paths]
+            found.sort(key=lambda hit: (lvoc.natural_key(hit.set_name), hit.row))
+            for hit in found:
+                hits.append((paths[hit.set_name], hit.row))
+                results.insert(tk.END, f"{hit.set_name}: {hit.question} — {hit.answer}")
+            if not found:
+                results.insert(tk.END, "No matching question.")
+            results.grid(column=0, row=1, columnspan=2, sticky="EW", pady=PADDING)
+
+        def on_result_opened(event: tk.Event):
+            selection = results.curselection()
+            if selection and selection[0] < len(hits):
+                path, row = hits[selection[0]]
+                if path in self.__edit_callbacks:
+                    self.__edit_callbacks[path](row)
+
+        query_var.trace_add("write", lambda a, b, c: on_query_changed())
+        results.bind("<Double-Button-1>", on_result_opened)
+        results.bind("<Return>", on_result_opened)
+        return search_frame
+
+    def __get_search_index(self) -> SearchIndex:
+        """Returns the search index, loading and updating it first if needed."""
+        if self.__search_index is None:
+            self.__search_index = SearchIndex.load(lvoc.SEARCH_INDEX_PATH)
+            self.__refresh_search_index()
+        return self.__search_index
+
+    def __refresh_search_index(self) -> None:
+        """Indexes the sets that changed since they were indexed, if the index was loaded."""
+        if self.__search_index is None:
+            return
+        self.__search_index.refresh(self.sets.values())
+        try:
+            self.__search_index.save()
+        except OSError as e:
+            print(f"Error saving the search index: {e}")
+
+    def __poll_save_errors(self, widget: tk.Misc) -> None:
+        """Reports the errors of background saves, and checks again later."""
+        for qset, e in SAVE_QUEUE.pop_errors():
+            tkmsgbox.showerror(
+                title="Save Error",
+                message=f"Could not save '{getattr(qset, 'name', qset)}'.",
+                detail=str(e),
+                icon="error"
+            )
+        widget.after(_SAVE_ERROR_POLL_MS, lambda: self.__poll_save_errors(widget))
+
     def add_set(self, qset: lvoc.QuestionSet, name_var: tk.StringVar | None = None) -> TreePath:
         """Adds a new question set to the selection page."""
         
@@ -135,6 +235,10 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         # Center the button within the full-width grid cell.
         btn.grid(column=0, row=idx, padx=PADDING, pady=PADDING, sticky="EW")
 
+        summary_label = ttk.Label(button_frame, text=_summary_text(qset.summary()))
+        summary_label.grid(column=1, row=idx, padx=PADDING, pady=PADDING, sticky="W")
+        self.__summary_labels[path] = summary_label
+
         selection_buttons.stylify_button(
             btn,
             self._selection_state,
@@ -142,7 +246,9 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         )
 
         # Edit button
-        def __edit_callback():
+        def __edit_callback(row: int | None = None):
+            if not self._load_set(qset):
+                return
             new_page = self.__menu_treer.create_subpage(
                 self,
                 sticky="NSEW",
@@ -190,16 +296,19 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
 
             set_page.display_page()
             self.__menu_treer.page_switcher.show_page(new_page)
+            if row is not None:
+                set_page.show_row(row)
 
             btn.config(textvariable=set_page.name_var)
         
+        self.__edit_callbacks[path] = __edit_callback
         edit_btn = ttk.Button(button_frame, text="Edit", command=__edit_callback)
-        edit_btn.grid(column=1, row=idx, pady=PADDING, padx=PADDING)
+        edit_btn.grid(column=2, row=idx, pady=PADDING, padx=PADDING)
 
         delete_btn = ttk.Button(button_frame, text="✕", command=lambda: self.delete_set(path, warn=True, delete_files=True), width=_DELETE_BUTTON_WIDTH)
-        delete_btn.grid(column=2, row=idx, pady=PADDING, padx=PADDING)
+        delete_btn.grid(column=3, row=idx, pady=PADDING, padx=PADDING)
 
-        self.__buttons[path] = [btn, edit_btn, delete_btn]
+        self.__buttons[path] = [btn, summary_label, edit_btn, delete_btn]
         return path
 
     def add_new_set(self) -> TreePath:
@@ -207,7 +316,7 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         Adds a new empty question set to the selection page.
         Will automatically show the edit page for the new set, and closing forces saving or deleting the new set.
         """
-        new_set = lvoc.QuestionSet()
+        new_set = lvoc.QuestionSet.new(self.__storage)
         name_var = tk.StringVar(value=new_set.name)
         path = self.add_set(new_set, name_var=name_var)
         # Build and show edit page
@@ -277,6 +386,9 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
             if not result:
                 return
         if delete_files:
+            # Pending saves would write the files again
+            SAVE_QUEUE.cancel(self.sets[set_path])
+            SAVE_QUEUE.flush()
             self.sets[set_path].delete()
 
         
@@ -285,6 +397,8 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
         for widget in self.__buttons[set_path]:
             widget.destroy()
         del self.__buttons[set_path]
+        del self.__summary_labels[set_path]
+        del self.__edit_callbacks[set_path]
 
     def _guarded_save(self, set: lvoc.QuestionSet, path: TreePath, name_var: tk.StringVar | None = None):
         """
@@ -298,7 +412,7 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
                 if other_path != path and other_set.name == set.name:
                     raise SaveError(f"A set named '{set.name}' already exists.")
                 
-            set.save()
+            request_save(set)
         except SaveError:
             # Ask if override or rename
             result = tkmsgbox.askyesno(
@@ -312,7 +426,7 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
                 for other_path, other_set in list(self.sets.items()):
                     if other_path != path and other_set.name == set.name:
                         self.delete_set(other_path, warn=False, delete_files=True)
-                set.save()
+                request_save(set)
             else:
                 # Find available name
                 base_name = set.name
@@ -330,9 +444,45 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
                 if name_var is not None:
                     name_var.set(new_name)
                 set.name = new_name
-                set.save()
+                request_save(set)
         self.sets[path] = set
 
+    def refresh_summaries(self) -> None:
+        """Updates the question count and mastery shown for the loaded sets."""
+        for path, label in self.__summary_labels.items():
+            qset = self.sets[path]
+            if qset.is_loaded:
+                label.config(text=_summary_text(qset.summary()))
+
+    def _load_set(self, qset: lvoc.QuestionSet) -> bool:
+        """Loads the questions of a set if not done yet. Returns False and reports the error if it fails."""
+        return bool(self._load_sets([qset]))
+
+    def _load_sets(self, sets: list[lvoc.QuestionSet]) -> list[lvoc.QuestionSet]:
+        """Loads the questions of sets concurrently. Returns the loaded sets, and reports those that failed."""
+        loaded = lvoc.load_sets(sets)
+        if loaded.errors:
+            names = ", ".join(f"'{qset.name}'" for qset, _ in loaded.errors)
+            tkmsgbox.showerror(
+                title="Load Error",
+                message=f"Could not load {names}.",
+                detail="\n".join(f"{qset.name}: {e}" for qset, e in loaded.errors),
+                icon="error"
+            )
+        return loaded.sets
+
+    def compact_score_journals(self) -> None:
+        """Merges the score journals of all sets into their score files, and updates the manifest of the sets."""
+        for qset in self.sets.values():
+            try:
+                qset.compact_journal()
+            except OSError as e:
+                print(f"Error compacting the scores of {qset.name}: {e}")
+        try:
+            lvoc.QuestionSet.update_manifest(self.sets.values())
+        except OSError as e:
+            print(f"Error saving the vocabulary manifest: {e}")
+
     def select_all_button(self, root: tk.Misc) -> ttk.Button:
         """Returns the 'Select All' button."""
         return selection_buttons.select_all_button(
@@ -344,16 +494,23 @@ class VocabularySelectionPage(selection_buttons.HeaderedWithSelectAll[TreePages.
     def to_question_drawers(self) -> list[QD]:
         """Returns a list of QuestionDrawers for all selected sets."""
         question_drawers: list[QD] = []
-        for path in self.__selected:
-            if path in self.sets:
-                qset = self.sets[path]
-                set_with_delete = SetWithDelete(qset)
-                for idx in range(len(qset.questions)):
-                    qd = QuestionDrawer(
-                        question_idx=idx,
-                        question_set=set_with_delete
-                    )
-                    question_drawers.append(qd)
+        selected_sets = [self.sets[path] for path in self.__selected if path in self.sets]
+        # Shared by the sets, so that answers are checked against all questions of the session
+        index = QuestionIndex()
+        for qset in self._load_sets(selected_sets):
+            set_with_delete = SetWithDelete(qset, index)
+            for idx in range(len(qset.questions)):
+                qd = QuestionDrawer(
+                    question_idx=idx,
+                    question_set=set_with_delete
+                )
+                question_drawers.append(qd)
+        # Filled now rather than at the first wrong answer
+        if fuzzy.TYPO_TOLERANCE > 0:
+            index.fill_answers()
+        if LIVE_FEEDBACK:
+            # Filled now rather than at the first keystroke
+            index.fill_prefixes()
         return question_drawers
 
 class SetPage(Page):
@@ -422,6 +579,11 @@ class SetPage(Page):
                 self._on_delete()
             self.destroy()
 
+        def highlight(self) -> None:
+            """Gives focus to the answer of the row, with its text selected."""
+            self._answer_entry.focus_set()
+            self._answer_entry.select_range(0, tk.END)
+
     def __init__(
             self, 
             root: tk.Misc, 
@@ -461,6 +623,7 @@ class SetPage(Page):
 
         scrollbar_page = ScrollablePage(questions_frame)
         scrollbar_page.display_page()
+        self._scrollable_page = scrollbar_page
 
         self._scrollable_frame = scrollbar_page.frame
         self._scrollable_frame.columnconfigure(0, weight=1)
@@ -515,6 +678,14 @@ class SetPage(Page):
         """Returns the vocabulary set displayed in this page."""
         return self._set_helper.set
 
+    def show_row(self, row: int) -> None:
+        """Scrolls to the row of the question at the given position in the set, and highlights it."""
+        rows = [widget for widget in self._scrollable_frame.winfo_children() if isinstance(widget, SetPage.Row)]
+        if not 0 <= row < len(rows):
+            return
+        self._scrollable_page.see(rows[row])
+        rows[row].highlight()
+
     def check_saved(self) -> bool:
         """Checks if the current in-memory set matches the saved file."""
         return self._set_helper.check_saved()
@@ -538,10 +709,13 @@ class SetPage(Page):
     
 # Export the logic of sets supporting deletion from SetPage to own class
 class SetWithDelete():
-    """A QuestionSet that supports addition and deletion of its questions."""
+    """A QuestionSet that supports addition and deletion of its questions.
+    
+    When an index is given, its questions are kept in it, and it may be shared with other sets."""
     
-    def __init__(self, set: lvoc.QuestionSet):
+    def __init__(self, set: lvoc.QuestionSet, index: QuestionIndex | None = None):
         self.__set = set
+        self.index = index
         self._questions: dict[int, lvoc.Question] = {}
         self._next_free_index = len(self._questions)
         self._unused_indices: list[int] = []
@@ -563,12 +737,16 @@ class SetWithDelete():
         # Add storage and mapping
         if _add_to_list:
             self._questions[index] = question
+            if self.index is not None:
+                self.index.add(question)
         if _add_to_set:
             self.__set.add_question(question)
         return index
     
     def delete_question(self, index: int):
-        del self._questions[index]
+        question = self._questions.pop(index)
+        if self.index is not None:
+            self.index.remove(question)
         self._unused_indices.append(index)
         self.__set_needs_rebuild = True
     
@@ -576,17 +754,23 @@ class SetWithDelete():
     def set(self) -> lvoc.QuestionSet:
         """Returns the vocabulary set displayed in this page."""
         if self.__set_needs_rebuild:
-            # Rebuild the set questions from current questions
-            self.__set.clear_all_questions()
-            for question in self._questions.values():
-                self.__set.add_question(question)
+            # Rebuild the set questions from current questions, so a background save never sees it half built
+            with self.__set._lock:
+                self.__set.clear_all_questions()
+                for question in self._questions.values():
+                    self.__set.add_question(question)
             self.__set_needs_rebuild = False
         return self.__set
 
     def restore(self) -> None:
         """Restores the set from file."""
+        # Files have to be written before they are read
+        SAVE_QUEUE.flush()
         self.set.restore()
 
+        if self.index is not None:
+            for question in self._questions.values():
+                self.index.remove(question)
         self._questions.clear()
         self._next_free_index = 0
         self._unused_indices.clear()
@@ -595,8 +779,8 @@ class SetWithDelete():
         self.__set_needs_rebuild = False
     
     def check_saved(self) -> bool:
-        """Checks if the current in-memory set matches the saved file."""
-        return self.set.check_saved()
+        """Checks if the current in-memory set matches the saved file, or will once its pending save is done."""
+        return SAVE_QUEUE.is_pending(self.set) or self.set.check_saved()
 
     def question_items(self):
         """Returns a list of (index, question) pairs for current questions."""
@@ -606,6 +790,11 @@ class SetWithDelete():
         """Returns the question at the given index."""
         return self._questions[index]
 
+    def update_question(self, index: int):
+        """Updates the index after the question at the given index was edited."""
+        if self.index is not None:
+            self.index.update(self._questions[index])
+
 # QD for a page.
 # Supports edition and deletion of questions, with edititon of the set the questions belong to.
 # Saves at each answer and modification of question.
@@ -629,10 +818,25 @@ class QuestionDrawer(QD):
     
     def get_average(self) -> float:
         return self._question_set.get_question(self._question_idx).average()
+
+    def get_streak(self) -> int:
+        return self._question_set.get_question(self._question_idx).streak
+
+    @classmethod
+    def get_columns(cls, drawers: Sequence[QD]) -> tuple[Sequence[float], Sequence[float]]:
+        """Returns the probabilities and the averages of all the given drawers, read from the score columns of their sets."""
+        averages = gather_averages([
+            drawer._question_set.get_question(drawer._question_idx)._score
+            for drawer in cast(Sequence[QuestionDrawer], drawers)
+        ])
+        if isinstance(averages, list):
+            return [1 - min(average, SCORE_CAP) for average in averages], averages
+        return 1 - averages.clip(max=SCORE_CAP), averages  # type: ignore
     
-    def draw(self, root: tk.Misc, on_answered: CallOnce) -> None:
+    def draw(self, root: tk.Misc, on_answered: CallOnce, on_deleted: CallOnce) -> None:
         """Draws the question on the given root widget. 
-        When the question is answered, the `on_answered` callback should be called, and the probability updated (and saved).
+        When the question is answered, the probability should be updated (and saved), and the `on_answered` callback
+        called with whether the answer was correct.
         When the question is deleted, the `on_deleted` callback should be called. This ensures the question is not displayed anymore.
         
         Can be called multiple times."""
@@ -648,6 +852,9 @@ class QuestionDrawer(QD):
             w.destroy()
 
         question = self._question_set.get_question(self._question_idx)
+        # Drawers are made by to_question_drawers, which shares an index between the sets
+        index = self._question_set.index
+        assert index is not None
 
         # Top: question text
         question_frame = ttk.Frame(root)
@@ -660,6 +867,26 @@ class QuestionDrawer(QD):
         answer_entry = ttk.Entry(root, textvariable=entry_var)
         answer_entry.grid(column=0, row=1, sticky="EW", padx=PADDING, pady=PADDING)
 
+        # Tells while typing whether the answer can still be the correct one, or the one of another question
+        live_label: ttk.Label | None = None
+        if LIVE_FEEDBACK:
+            live_label = ttk.Label(root, width=len("another answer"))
+            live_label.grid(column=1, row=1, sticky="W", padx=PADDING, pady=PADDING)
+
+            def on_typed():
+                assert live_label is not None
+                prefix_key = normalize_prefix(entry_var.get())
+                if not prefix_key:
+                    live_label.config(text="")
+                elif question.answer_key.startswith(prefix_key):
+                    live_label.config(text="on track", foreground="green")
+                elif index.count_answers_with_prefix(prefix_key) > 0:
+                    live_label.config(text="another answer", foreground="orange")
+                else:
+                    live_label.config(text="no answer", foreground="red")
+
+            entry_var.trace_add("write", lambda a, b, c: on_typed())
+
         # Container for result / edit area
         result_frame = ttk.Frame(root)
         result_frame.grid(column=0, row=2, sticky="NSEW", padx=PADDING, pady=PADDING)
@@ -670,10 +897,19 @@ class QuestionDrawer(QD):
 
         def do_save():
             try:
-                self._question_set.set.save()
+                request_save(self._question_set.set)
             except ValueError as e:
                 tkmsgbox.showerror(title="Save Error", message=str(e), icon="error")
 
+        def do_record_answer(correct: bool):
+            qset = self._question_set.set
+            try:
+                qset.record_history(question, correct)
+                if not qset.record_answer(question, save=False):
+                    request_save(qset)
+            except (ValueError, OSError) as e:
+                tkmsgbox.showerror(title="Save Error", message=str(e), icon="error")
+
         def clear_result_frame():
             for w in result_frame.winfo_children():
                 w.destroy()
@@ -688,26 +924,42 @@ class QuestionDrawer(QD):
             given = entry_var.get().strip()
             correct_answer = question.answer.strip()
 
-            correct = (given.lower() == correct_answer.lower())
+            if live_label is not None:
+                live_label.destroy()
+
+            given_key = normalize(given)
+            correct = (given_key == question.answer_key)
+            almost_correct = False
             clear_result_frame()
 
             if not correct:
                 # Check if there is a question with same question:
-                for _, other_question in self._question_set.question_items():
-                    if other_question.question.strip().lower() == question.question.strip().lower() and other_question.answer.strip().lower() == given.lower():
-                        label = ttk.Label(result_frame, text=f"Correct but please give another word.", foreground="orange")
-                        label.grid(column=0, row=0, sticky="W", padx=PADDING, pady=PADDING)
-                        return
-
-                # Check if there is a question with same answer:
-                other_questions: list[str] = []
-                for _, other_question in self._question_set.question_items():
-                    if other_question.answer.strip().lower() == given.lower():
-                        other_questions.append(other_question.question)
+                if index.with_question_and_answer(question.question_key, given_key):
+                    label = ttk.Label(result_frame, text=f"Correct but please give another word.", foreground="orange")
+                    label.grid(column=0, row=0, sticky="W", padx=PADDING, pady=PADDING)
+                    return
+
+                # Tell apart answers with a few typos, which still count as incorrect
+                max_typos = fuzzy.tolerance(question.answer_key)
+                almost_correct = fuzzy.distance(given_key, question.answer_key, max_typos) <= max_typos
+
+            if almost_correct:
+                label = ttk.Label(result_frame, text=f"Almost correct. Correct answer: '{correct_answer}'", foreground="orange")
+                label.grid(column=0, row=0, sticky="W", padx=PADDING, pady=PADDING)
+            elif not correct:
+                # Check if there is a question with same answer, or else with a close one:
+                other_questions = [other_question.question for other_question in index.with_answer(given_key)]
+                relation = "correct"
+                if not other_questions:
+                    near_questions = index.near_answer(given_key, fuzzy.tolerance(given_key))
+                    other_questions = [
+                        other_question.question for _, other_question in near_questions if other_question is not question
+                    ]
+                    relation = "close to the answer"
                 
                 if len(other_questions) > 0:
                     clear_result_frame()
-                    label = ttk.Label(result_frame, text=f"'{given}' is correct for:", foreground="red")
+                    label = ttk.Label(result_frame, text=f"'{given}' is {relation} for:", foreground="red")
                     label.grid(column=0, row=1, sticky="W", padx=PADDING, pady=PADDING)
 
                     for idx, oq in enumerate(other_questions):
@@ -728,7 +980,7 @@ class QuestionDrawer(QD):
             
             # Update score
             question.update_score(correct)
-            do_save()
+            do_record_answer(correct)
 
             # Disable entry
             answer_entry.config(state="readonly")
@@ -737,16 +989,29 @@ class QuestionDrawer(QD):
             edit_btn = ttk.Button(question_frame)
             edit_btn.grid(column=1, row=0, padx=PADDING, pady=PADDING)
 
+            def delete_callback():
+                self._question_set.delete_question(self._question_idx)
+                do_save()
+
+                for w in question_frame.winfo_children():
+                    w.destroy()
+                ttk.Label(question_frame, text="Deleted").grid(column=0, row=0, sticky="W", padx=PADDING, pady=PADDING)
+
+                on_deleted()
+
             def edit_callback(): 
                 row = SetPage.Row(
                     question_frame,
                     question,
-                    tk.BooleanVar(value=True)
+                    tk.BooleanVar(value=True),
+                    delete_callback
                 )
                 row.grid(column=0, row=0, sticky="EW")
 
                 def confirm_callback():
                     row.make_editable(False)
+                    self._question_set.update_question(self._question_idx)
+                    do_save()
                     edit_btn.config(text="Edit", command=edit_callback)
                 
                 edit_btn.config(text="Confirm", command=confirm_callback)
@@ -761,9 +1026,15 @@ class QuestionDrawer(QD):
 
             # Call on_answered callback after updating
             if on_answered:
-                on_answered()
+                on_answered(correct)
 
         submit_btn.config(command=handle_submit)
 
-        # Give focus to entry
-        answer_entry.focus_set()
\ No newline at end of file
+        # Give focus to entry, once displayed as the question may be drawn off-screen
+        if root.winfo_ismapped():
+            answer_entry.focus_set()
+        else:
+            def on_map(event: tk.Event):
+                root.unbind("<Map>", map_binding)
+                answer_entry.focus_set()
+            map_binding = root.bind("<Map>", on_map, add="+")
\ No newline at end of file
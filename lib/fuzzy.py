@@ -0,0 +1,110 @@
+"""Typo tolerant comparison of answers, by edit distance."""
+
+from typing import Iterator
+
+# Number of typos an answer may have to be reported as almost correct, it is still scored as incorrect
+TYPO_TOLERANCE = 1
+
+# Number of characters of an answer per typo accepted, so that short answers need to be exact
+CHARACTERS_PER_TYPO = 4
+
+
+def tolerance(answer: str) -> int:
+    """Returns the number of typos tolerated in an answer of the length of answer."""
+    return min(TYPO_TOLERANCE, len(answer) // CHARACTERS_PER_TYPO)
+
+def distance(a: str, b: str, limit: int | None = None) -> int:
+    """Returns the Levenshtein distance between a and b.
+
+    If limit is given, returns limit + 1 as soon as the distance is known to be above limit.
+    Computed a column at a time with bit vectors (Myers' algorithm), so in O(len(a) + len(b)) for short strings.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+
+    # Bit i of the mask of a character is set if b[i] is that character
+    masks: dict[str, int] = {}
+    for i, c in enumerate(b):
+        masks[c] = masks.get(c, 0) | (1 << i)
+
+    m = len(b)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    # Vertical positive and negative differences of the current column
+    pv, mv = full, 0
+    score = m
+    remaining = len(a)
+    for c in a:
+        eq = masks.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        # The distance decreases by at most one per remaining character
+        if limit is not None and score - remaining > limit:
+            return limit + 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    return score
+
+class BKTree:
+    """Strings in a Burkhard-Keller tree, to find those within an edit distance of a string without comparing all.
+
+    Each node keeps its children by their distance to it, so that by the triangle inequality,
+    a search only descends into the children whose distance is close to the one of the string searched.
+    """
+    def __init__(self):
+        # Node: (string, children by distance)
+        self.__root: tuple[str, dict[int, tuple]] | None = None
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def add(self, string: str):
+        """Adds a string to the tree, if it is not in it yet."""
+        if self.__root is None:
+            self.__root = (string, {})
+            self.__size = 1
+            return
+
+        node = self.__root
+        while True:
+            d = distance(string, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = (string, {})
+                self.__size += 1
+                return
+            node = child
+
+    def search(self, string: str, max_distance: int) -> list[tuple[int, str]]:
+        """Returns the strings within max_distance of string, with their distance, closest first."""
+        return sorted(self.__search(string, max_distance))
+
+    def __search(self, string: str, max_distance: int) -> Iterator[tuple[int, str]]:
+        if self.__root is None:
+            return
+        stack = [self.__root]
+        while stack:
+            node_string, children = stack.pop()
+            # Past the farthest child, the distance is not needed exactly: neither the node nor a child can match
+            d = distance(string, node_string, max(children, default=0) + max_distance)
+            if d <= max_distance:
+                yield d, node_string
+            for child_distance, child in children.items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    stack.append(child)
@@ -0,0 +1,125 @@
+"""Per-set history of every answer, stored as compact binary events."""
+
+from pathlib import Path
+import os
+import struct
+import time
+import zlib
+
+from typing import Iterator, NamedTuple
+
+# History files start with a magic and a version, followed by fixed size little-endian events
+MAGIC = b"VOCH"
+VERSION = 1
+_HEADER = struct.Struct("<4sH")
+# Question id, timestamp in seconds since the epoch, and whether the answer was correct
+_EVENT = struct.Struct("<Id?")
+EVENT_SIZE = _EVENT.size
+
+# Number of events decoded at once when reading
+READ_CHUNK_EVENTS = 4096
+
+
+class AnswerEvent(NamedTuple):
+    """An answer to a question."""
+    question_id: int
+    timestamp: float
+    correct: bool
+
+
+def question_id(question: str, answer: str) -> int:
+    """Returns the id of a question in histories, which only depends on its question and answer strings."""
+    return zlib.crc32(f"{question}\t{answer}".encode("utf-8"))
+
+
+class HistoryFile:
+    """Handles appending to and reading the answer history of a set."""
+
+    def __init__(self, folder: Path, name: str):
+        self.__folder = folder
+        self.__name = name
+        self.__filepath = self._filepath_for_name(name)
+        # Whether a torn last event was looked for, before appending
+        self.__checked = False
+
+    def _filepath_for_name(self, name: str) -> Path:
+        return self.__folder / f"{name}.voc_history"
+
+    @property
+    def filepath(self) -> Path:
+        """Returns the path of the history file."""
+        return self.__filepath
+
+    def append(self, question_id: int, correct: bool, timestamp: float | None = None):
+        """Appends an answer to the history."""
+        if timestamp is None:
+            timestamp = time.time()
+
+        with open(self.__filepath, "ab") as f:
+            size = f.tell()
+            if not self.__checked:
+                # Drop a header or event torn by an interrupted write, so the next events stay aligned
+                if size < _HEADER.size:
+                    torn = size
+                else:
+                    torn = (size - _HEADER.size) % EVENT_SIZE
+                if torn:
+                    size -= torn
+                    os.truncate(f.fileno(), size)
+                self.__checked = True
+            if size == 0:
+                f.write(_HEADER.pack(MAGIC, VERSION))
+            f.write(_EVENT.pack(question_id, timestamp, correct))
+
+    def events(self) -> Iterator[AnswerEvent]:
+        """Iterates over the answers in the history, in the order they were given.
+
+        The file is read in chunks, so large histories are never loaded fully. A torn last event is ignored.
+        """
+        if not self.__filepath.exists():
+            return
+
+        with open(self.__filepath, "rb") as f:
+            header = f.read(_HEADER.size)
+            if not header:
+                return
+            if len(header) < _HEADER.size or _HEADER.unpack(header)[0] != MAGIC:
+                raise ValueError(f"Not a history file: {self.__filepath}")
+            version = _HEADER.unpack(header)[1]
+            if version != VERSION:
+                raise ValueError(f"Unsupported history file version: {version}")
+
+            while chunk := f.read(EVENT_SIZE * READ_CHUNK_EVENTS):
+                full = len(chunk) - len(chunk) % EVENT_SIZE
+                for event in _EVENT.iter_unpack(chunk[:full]):
+                    yield AnswerEvent._make(event)
+                if full < len(chunk):
+                    return
+
+    def rename(self):
+        """Moves the history file to the path of its current name."""
+        new_filepath = self._filepath_for_name(self.__name)
+        if new_filepath == self.__filepath:
+            return
+        try:
+            self.__filepath.rename(new_filepath)
+        except FileNotFoundError:
+            pass
+        self.__filepath = new_filepath
+
+    def delete(self):
+        """Deletes the history file."""
+        try:
+            self.__filepath.unlink()
+        except FileNotFoundError:
+            pass
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the history file."""
+        return self.__name
+
+    @name.setter
+    def name(self, new_name: str):
+        """Renames the history file, which is moved on the next call to `rename`."""
+        self.__name = new_name
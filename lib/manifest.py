@@ -0,0 +1,107 @@
+"""Cache of the summaries of the vocabulary sets, to list them without reading their files."""
+
+from pathlib import Path
+import json
+import os
+import tempfile
+
+from typing import Iterable, NamedTuple
+
+MANIFEST_VERSION = 1
+
+# Modification time in nanoseconds and size of a file, None if it does not exist
+FileStat = tuple[int, int] | None
+
+
+class SetSummary(NamedTuple):
+    """Number of questions of a set, and their mean average score."""
+    count: int
+    mastery: float
+
+
+def scan_folder(folder: Path, suffix: str) -> dict[str, tuple[int, int]]:
+    """Returns the modification time and size of the files of folder ending with suffix, by name without the suffix."""
+    stats: dict[str, tuple[int, int]] = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    stat = entry.stat()
+                    stats[entry.name[:-len(suffix)]] = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        pass
+    return stats
+
+def file_stat(path: Path) -> FileStat:
+    """Returns the modification time and size of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Manifest:
+    """Summaries of the sets, each valid as long as the files of the set are unchanged."""
+
+    def __init__(self, path: Path):
+        self.__path = path
+        # Name -> (stats of the files, summary)
+        self.__entries: dict[str, tuple[list[FileStat], SetSummary]] = {}
+        self.__changed = False
+
+    @classmethod
+    def load(cls, path: Path) -> "Manifest":
+        """Loads the manifest file. A missing or unreadable manifest is empty."""
+        manifest = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return manifest
+            for name, entry in data["sets"].items():
+                stats = [tuple(stat) if stat is not None else None for stat in entry["stats"]]
+                manifest.__entries[name] = (stats, SetSummary(entry["count"], entry["mastery"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            manifest.__entries.clear()
+        return manifest
+
+    def get(self, name: str, stats: Iterable[FileStat]) -> SetSummary | None:
+        """Returns the summary of a set, or None if it is unknown or its files changed since."""
+        entry = self.__entries.get(name)
+        if entry is None or entry[0] != list(stats):
+            return None
+        return entry[1]
+
+    def set(self, name: str, stats: Iterable[FileStat], summary: SetSummary):
+        """Sets the summary of a set, for the given stats of its files."""
+        entry = (list(stats), summary)
+        if self.__entries.get(name) != entry:
+            self.__entries[name] = entry
+            self.__changed = True
+
+    def prune(self, names: Iterable[str]):
+        """Forgets the sets not in names."""
+        keep = set(names)
+        for name in list(self.__entries):
+            if name not in keep:
+                del self.__entries[name]
+                self.__changed = True
+
+    def save(self):
+        """Saves the manifest file, if it changed."""
+        if not self.__changed:
+            return
+        data = {
+            "version": MANIFEST_VERSION,
+            "sets": {
+                name: {"stats": stats, "count": summary.count, "mastery": summary.mastery}
+                for name, (stats, summary) in self.__entries.items()
+            },
+        }
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.__path.parent, encoding="utf-8", delete=False) as f:
+            json.dump(data, f)
+            temp_name = f.name
+        Path(temp_name).replace(self.__path)
+        self.__changed = False
@@ -0,0 +1,56 @@
+"""Canonical forms of questions and answers, so that they are compared regardless of case, spacing and spelling variants."""
+
+import re
+import unicodedata
+
+# Whether ß and ss, and ä, ö, ü and ae, oe, ue are the same
+FOLD_SPELLING = False
+
+# Whether a leading article is ignored, so that "der Wagen" is the same as "Wagen"
+STRIP_ARTICLES = False
+
+# German and French articles, as they are after folding
+ARTICLES = frozenset({
+    "der", "die", "das", "den", "dem", "des",
+    "ein", "eine", "einen", "einem", "einer", "eines",
+    "le", "la", "les", "un", "une",
+})
+# Elided French article, as in "l'avis"
+_ELIDED_ARTICLE = re.compile(r"l['’]\s*")
+
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
+
+
+def options() -> tuple[bool, bool]:
+    """Returns the current normalization options. Normalized forms computed with other options are out of date."""
+    return FOLD_SPELLING, STRIP_ARTICLES
+
+def normalize(text: str) -> str:
+    """Returns the canonical form of a question or answer."""
+    if FOLD_SPELLING:
+        # Case folding also turns ß into ss
+        text = text.casefold()
+        if not text.isascii():
+            text = unicodedata.normalize("NFC", text).translate(_UMLAUTS)
+    else:
+        text = text.lower()
+        if not text.isascii():
+            text = unicodedata.normalize("NFC", text)
+
+    words = text.split()
+    if STRIP_ARTICLES and words:
+        if len(words) > 1 and (words[0] in ARTICLES or _ELIDED_ARTICLE.fullmatch(words[0])):
+            del words[0]
+        elif (match := _ELIDED_ARTICLE.match(words[0])) and match.end() < len(words[0]):
+            words[0] = words[0][match.end():]
+    return " ".join(words)
+
+def normalize_prefix(text: str) -> str:
+    """Returns the canonical form of the start of a question or answer, as it is typed.
+    
+    While only a leading article is typed, that would be stripped from the whole text, returns an empty string."""
+    key = normalize(text)
+    if STRIP_ARTICLES and " " not in key:
+        if any(article.startswith(key) for article in ARTICLES) or "l'".startswith(key) or "l’".startswith(key):
+            return ""
+    return key
@@ -0,0 +1,124 @@
+"""Background saving of files, off the thread of the user interface."""
+
+import atexit
+import queue
+import threading
+import time
+
+from typing import Callable, Hashable
+
+# Time in seconds a save request waits for other requests of the same target, to be saved once
+COALESCE_DELAY = 0.5
+
+
+class SaveQueue:
+    """Runs save functions on a single background writer thread.
+
+    Requests for the same target within `delay` seconds of the first one are coalesced: only the last
+    save function requested is run. Saves run one at a time, in the order of their first request.
+    Errors are not raised on the writer thread, but collected to be reported by `pop_errors`.
+    """
+    def __init__(self, delay: float = COALESCE_DELAY):
+        self.__delay = delay
+        self.__condition = threading.Condition()
+        # Target -> (deadline, save function), in request order
+        self.__pending: dict[Hashable, tuple[float, Callable[[], None]]] = {}
+        self.__running = 0
+        # Target whose save is running, no longer pending but not saved yet
+        self.__saving: Hashable | None = None
+        self.__flushing = 0
+        self.__closed = False
+        self.__thread: threading.Thread | None = None
+        self.__errors: queue.SimpleQueue[tuple[Hashable, Exception]] = queue.SimpleQueue()
+
+    def request(self, target: Hashable, save: Callable[[], None]):
+        """Requests `save` to be run to save target, replacing a pending request for it."""
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("Save queue is closed.")
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="SaveQueue", daemon=True)
+                self.__thread.start()
+                atexit.register(self.close)
+
+            if target in self.__pending:
+                deadline = self.__pending[target][0]
+            else:
+                deadline = time.monotonic() + self.__delay
+            self.__pending[target] = (deadline, save)
+            self.__condition.notify_all()
+
+    def cancel(self, target: Hashable) -> bool:
+        """Cancels the pending request for target. Returns False if there was none.
+
+        A save of target that already started is not interrupted, call `flush` to wait for it.
+        """
+        with self.__condition:
+            return self.__pending.pop(target, None) is not None
+
+    def is_pending(self, target: Hashable) -> bool:
+        """Returns True if a save of target was requested and is not done yet."""
+        with self.__condition:
+            return target in self.__pending or target == self.__saving
+
+    def flush(self):
+        """Runs every pending save without waiting for their delay, and waits until they are done."""
+        with self.__condition:
+            if self.__thread is None:
+                return
+            self.__flushing += 1
+            self.__condition.notify_all()
+            try:
+                self.__condition.wait_for(lambda: not self.__pending and not self.__running)
+            finally:
+                self.__flushing -= 1
+
+    def close(self):
+        """Flushes the queue and stops the writer thread. Further requests are refused."""
+        self.flush()
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+            thread = self.__thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def pop_errors(self) -> list[tuple[Hashable, Exception]]:
+        """Returns the targets that could not be saved with their error, since the last call."""
+        errors: list[tuple[Hashable, Exception]] = []
+        while True:
+            try:
+                errors.append(self.__errors.get_nowait())
+            except queue.Empty:
+                return errors
+
+    def __next_save(self) -> tuple[Hashable, Callable[[], None]] | None:
+        """Waits for the next save to run, and takes it out of the pending requests. Returns None once closed."""
+        with self.__condition:
+            while True:
+                if self.__pending:
+                    target, (deadline, save) = next(iter(self.__pending.items()))
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0 or self.__flushing or self.__closed:
+                        del self.__pending[target]
+                        self.__running += 1
+                        self.__saving = target
+                        return target, save
+                    self.__condition.wait(timeout)
+                elif self.__closed:
+                    return None
+                else:
+                    self.__condition.wait()
+
+    def __run(self):
+        while (item := self.__next_save()) is not None:
+            target, save = item
+            try:
+                save()
+            except Exception as e:
+                self.__errors.put((target, e))
+            finally:
+                with self.__condition:
+                    self.__running -= 1
+                    self.__saving = None
+                    self.__condition.notify_all()
@@ -0,0 +1,123 @@
+"""Index of a pool of questions by their normalized question and answer, to check answers in constant time."""
+
+from typing import Iterable, TypeVar
+
+from lib.fuzzy import BKTree
+from lib.trie import PrefixTrie
+from lib.vocabulary import Question
+
+_K = TypeVar("_K")
+
+
+class QuestionIndex:
+    """Questions of a pool, by normalized answer and by normalized question and answer.
+
+    Questions are indexed under their normalized strings when added: edited questions have to be updated,
+    and deleted ones removed. Lookups skip questions whose strings changed since.
+    """
+    def __init__(self, questions: Iterable[Question] = ()):
+        # Question -> (normalized question, normalized answer) it is indexed under
+        self.__keys: dict[Question, tuple[str, str]] = {}
+        # Dicts are used as ordered sets, so that lookups return questions in the order they were added
+        self.__by_answer: dict[str, dict[Question, None]] = {}
+        self.__by_pair: dict[tuple[str, str], dict[Question, None]] = {}
+        # Every normalized answer indexed so far, to find those close to a given answer.
+        # Answers that are no longer indexed stay in the tree, but have no question.
+        # The tree is only filled once needed or asked to, as building it is much slower than hashing.
+        self.__answers = BKTree()
+        self.__new_answers: list[str] = []
+        # Normalized answers of the questions indexed, by prefix.
+        # Only filled once needed, the additions and removals until then are kept in order.
+        self.__prefixes: PrefixTrie | None = None
+        self.__prefix_changes: list[tuple[str, int]] = []
+
+        for question in questions:
+            self.add(question)
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, question: object) -> bool:
+        return question in self.__keys
+
+    def add(self, question: Question):
+        """Adds a question to the index. Adding a question already indexed updates it."""
+        self.remove(question)
+        key = (question.question_key, question.answer_key)
+        self.__keys[question] = key
+        self.__new_answers.append(key[1])
+        self.__prefix_changes.append((key[1], 1))
+        self.__by_answer.setdefault(key[1], {})[question] = None
+        self.__by_pair.setdefault(key, {})[question] = None
+
+    def remove(self, question: Question):
+        """Removes a question from the index, if it is in it."""
+        key = self.__keys.pop(question, None)
+        if key is None:
+            return
+        self.__prefix_changes.append((key[1], -1))
+        self.__discard(self.__by_answer, key[1], question)
+        self.__discard(self.__by_pair, key, question)
+
+    def update(self, question: Question):
+        """Indexes a question under its current strings, after it was edited."""
+        if question in self.__keys:
+            self.add(question)
+
+    @staticmethod
+    def __discard(buckets: dict[_K, dict[Question, None]], key: _K, question: Question):
+        bucket = buckets[key]
+        del bucket[question]
+        if not bucket:
+            del buckets[key]
+
+    def with_answer(self, answer_key: str) -> list[Question]:
+        """Returns the questions of the pool whose normalized answer is answer_key."""
+        return [question for question in self.__by_answer.get(answer_key, ()) if question.answer_key == answer_key]
+
+    def with_question_and_answer(self, question_key: str, answer_key: str) -> list[Question]:
+        """Returns the questions of the pool whose normalized question and answer are question_key and answer_key."""
+        key = (question_key, answer_key)
+        return [
+            q for q in self.__by_pair.get(key, ())
+            if (q.question_key, q.answer_key) == key
+        ]
+
+    def near_answer(self, answer_key: str, max_distance: int) -> list[tuple[int, Question]]:
+        """Returns the questions of the pool whose normalized answer is within max_distance typos of answer_key,
+        with their distance, closest first."""
+        if max_distance <= 0:
+            # Hashing finds them without filling the tree
+            return [(0, question) for question in self.with_answer(answer_key)]
+
+        return [
+            (distance, question)
+            for distance, near_key in self.fill_answers().search(answer_key, max_distance)
+            for question in self.__by_answer.get(near_key, ())
+            if question.answer_key == near_key
+        ]
+
+    def fill_answers(self) -> BKTree:
+        """Fills the tree of the answers with those indexed since it was last filled, and returns it.
+
+        Called by the first search of close answers, but filling it for a large pool takes longer than an answer."""
+        for new_answer in self.__new_answers:
+            self.__answers.add(new_answer)
+        self.__new_answers.clear()
+        return self.__answers
+
+    def fill_prefixes(self) -> PrefixTrie:
+        """Fills the trie of the answers by prefix with the changes since it was last filled, and returns it.
+        
+        Called by the first prefix lookup, but filling it for a large pool takes longer than a keystroke."""
+        if self.__prefixes is None:
+            self.__prefixes = PrefixTrie()
+        for answer_key, count in self.__prefix_changes:
+            self.__prefixes.add(answer_key, count)
+        self.__prefix_changes.clear()
+        return self.__prefixes
+
+    def count_answers_with_prefix(self, prefix_key: str) -> int:
+        """Returns the number of questions of the pool whose normalized answer starts with prefix_key,
+        as returned by `normalize_prefix`. Takes O(len(prefix_key)) once the trie is filled."""
+        return self.fill_prefixes().count(prefix_key)
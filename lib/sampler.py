@@ -0,0 +1,175 @@
+"""Weighted random sampling over a pool of indexed entries."""
+
+import random
+
+from math import fsum, nextafter
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, pure Python is used without it
+    np = None
+
+# Pool size from which weights are computed with NumPy, when available
+VECTORIZE_THRESHOLD = 4096
+
+
+def batch_weights(probabilities: Sequence[float], averages: Sequence[float], exponent: float) -> tuple[Any, Any]:
+    """Returns the weights `probability ** exponent` and progress terms `weight * average` of a pool.
+
+    Computed as array operations, and returned as NumPy arrays, for large pools or pools given as NumPy arrays
+    if NumPy is available. Lists are returned otherwise.
+    """
+    if np is not None and (isinstance(probabilities, np.ndarray) or len(probabilities) >= VECTORIZE_THRESHOLD):
+        weights = np.asarray(probabilities, dtype=np.float64) ** exponent
+        return weights, weights * np.asarray(averages, dtype=np.float64)
+
+    weights = [p ** exponent for p in probabilities]
+    numer_terms = [w * a for w, a in zip(weights, averages)]
+    return weights, numer_terms
+
+
+class WeightedSampler:
+    """Draws indices with a probability proportional to their weight.
+
+    Weights are kept in a Fenwick tree, so drawing, updating and removing an entry are O(log n).
+    Removed entries leave the tree entirely: they are never drawn and do not slow down drawing.
+    """
+    def __init__(self, weights: Iterable[float] = ()):
+        if np is not None and isinstance(weights, np.ndarray):
+            self.__weights: list[float] = weights.astype(np.float64).tolist()
+        else:
+            self.__weights = [float(w) for w in weights]
+
+        # Entries that were not removed, with the position of each one in that list (-1 once removed).
+        # Lets us count and uniformly draw the remaining entries in O(1).
+        self.__live: list[int] = list(range(len(self.__weights)))
+        self.__live_pos: list[int] = list(range(len(self.__weights)))
+
+        self.rebuild()
+
+    def rebuild(self):
+        """Rebuilds the Fenwick tree from the exact weights in O(n), discarding accumulated float drift."""
+        n = len(self.__weights)
+        if np is not None and n >= VECTORIZE_THRESHOLD:
+            # Node i covers the weights (i - lowbit(i), i], which is a difference of prefix sums
+            prefix = np.zeros(n + 1)
+            np.cumsum(self.__weights, out=prefix[1:])
+            nodes = np.arange(n + 1)
+            tree = (prefix - prefix[nodes - (nodes & -nodes)]).tolist()
+        else:
+            tree = [0.0] * (n + 1)
+            for i in range(1, n + 1):
+                tree[i] += self.__weights[i - 1]
+                parent = i + (i & -i)
+                if parent <= n:
+                    tree[parent] += tree[i]
+        self.__tree = tree
+
+        self.__top_bit = 1
+        while self.__top_bit * 2 <= n:
+            self.__top_bit *= 2
+
+    def __len__(self) -> int:
+        """Returns the number of entries that were not removed."""
+        return len(self.__live)
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of entries, removed ones included."""
+        return len(self.__weights)
+
+    @property
+    def total(self) -> float:
+        """Returns the sum of all weights."""
+        return self.prefix_sum(len(self.__weights))
+
+    def exact_total(self) -> float:
+        """Returns the sum of all weights, computed exactly from the weights in O(n)."""
+        return fsum(self.__weights)
+
+    def prefix_sum(self, end: int) -> float:
+        """Returns the sum of the weights of the entries before `end`."""
+        total = 0.0
+        i = end
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def weight(self, index: int) -> float:
+        """Returns the weight of the entry at `index`."""
+        return self.__weights[index]
+
+    def update(self, index: int, weight: float):
+        """Sets the weight of the entry at `index`. Ignored if the entry was removed."""
+        if self.is_removed(index):
+            return
+        self.__set_weight(index, float(weight))
+
+    def __set_weight(self, index: int, weight: float):
+        delta = weight - self.__weights[index]
+        self.__weights[index] = weight
+        n = len(self.__weights)
+        i = index + 1
+        while i <= n:
+            self.__tree[i] += delta
+            i += i & -i
+
+    def remove(self, index: int):
+        """Removes the entry at `index`, so it can never be drawn again."""
+        if self.is_removed(index):
+            return
+        self.__set_weight(index, 0.0)
+
+        # Swap with the last live entry and pop
+        pos = self.__live_pos[index]
+        last = self.__live.pop()
+        if last != index:
+            self.__live[pos] = last
+            self.__live_pos[last] = pos
+        self.__live_pos[index] = -1
+
+    def is_removed(self, index: int) -> bool:
+        """Returns True if the entry at `index` was removed."""
+        return self.__live_pos[index] < 0
+
+    def draw(self) -> int:
+        """Draws an index.
+
+        Falls back to a uniform draw among the remaining entries if none of them has weight.
+        Raises ValueError if every entry was removed.
+        """
+        if len(self.__live) == 0:
+            raise ValueError("Cannot draw from an empty sampler.")
+
+        total = self.total
+        if total <= 0:
+            return random.choice(self.__live)
+
+        target = random.random() * total
+        n = len(self.__weights)
+        pos = self.__find(target)
+
+        # Float drift in the tree can push us onto an entry without weight, or past the last one.
+        # Rebuild the tree from the exact weights, and walk again with the same target kept below their sum.
+        if pos >= n or self.__weights[pos] <= 0:
+            self.rebuild()
+            total = self.total
+            if total <= 0:
+                return random.choice(self.__live)
+            pos = min(self.__find(min(target, nextafter(total, 0.0))), n - 1)
+        return pos
+
+    def __find(self, target: float) -> int:
+        """Returns the first index whose prefix sum, itself included, exceeds target. Walks down the implicit tree."""
+        pos = 0
+        bit = self.__top_bit
+        n = len(self.__weights)
+        while bit:
+            nxt = pos + bit
+            if nxt <= n and self.__tree[nxt] <= target:
+                target -= self.__tree[nxt]
+                pos = nxt
+            bit >>= 1
+        return pos
@@ -0,0 +1,125 @@
+"""Spaced repetition scheduling of a pool of indexed entries."""
+
+import heapq
+import time
+
+from typing import Iterable
+
+# Duration of one interval, in seconds. Intervals are counted in this unit instead of days,
+# so that entries come back within a practice session.
+INTERVAL_UNIT = 30.0
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+# SM-2 answer qualities, from 0 (blackout) to 5 (perfect)
+CORRECT_QUALITY = 5
+INCORRECT_QUALITY = 2
+
+
+class SpacedScheduler:
+    """Schedules entries with the SM-2 algorithm.
+
+    Each entry has an ease, an interval and a due time. Entries waiting to be asked are kept
+    in a heap ordered by due time, so getting the next due entry is O(log n).
+    Entries are checked out with `pop` while asked, and come back with `record` or `requeue`.
+    """
+    def __init__(self, repetitions: Iterable[int] = ()):
+        """Creates a scheduler, each entry having already been answered correctly `repetitions` times in a row."""
+        now = time.monotonic()
+
+        self.__repetitions: list[int] = list(repetitions)
+        n = len(self.__repetitions)
+        self.__ease: list[float] = [DEFAULT_EASE] * n
+        self.__interval: list[float] = [self._next_interval(0.0, reps, DEFAULT_EASE) for reps in self.__repetitions]
+        self.__due: list[float] = [now + interval * INTERVAL_UNIT for interval in self.__interval]
+
+        # Entries are either waiting in the heap, checked out, or removed
+        self.__queued: list[bool] = [True] * n
+        self.__removed: list[bool] = [False] * n
+        self.__size = n
+
+        self.__heap: list[tuple[float, int]] = [(due, idx) for idx, due in enumerate(self.__due)]
+        heapq.heapify(self.__heap)
+
+    @staticmethod
+    def _next_interval(interval: float, repetitions: int, ease: float) -> float:
+        """Returns the SM-2 interval after the given number of correct repetitions in a row."""
+        if repetitions <= 0:
+            return 0.0
+        if repetitions == 1:
+            return 1.0
+        if repetitions == 2:
+            return 6.0
+        if interval <= 0:
+            # Replay the schedule, as we do not know the previous interval
+            interval = 6.0
+            for _ in range(repetitions - 2):
+                interval *= ease
+            return interval
+        return interval * ease
+
+    def __len__(self) -> int:
+        """Returns the number of entries that were not removed."""
+        return self.__size
+
+    def due(self, index: int) -> float:
+        """Returns the due time of the entry at `index`, on the `time.monotonic` clock."""
+        return self.__due[index]
+
+    def is_removed(self, index: int) -> bool:
+        """Returns True if the entry at `index` was removed."""
+        return self.__removed[index]
+
+    def pop(self) -> int:
+        """Checks out the entry with the earliest due time, even if it is not due yet.
+
+        Raises ValueError if no entry is waiting.
+        """
+        while self.__heap:
+            due, idx = heapq.heappop(self.__heap)
+            # Skip stale heap entries, left behind by removals and reschedules
+            if self.__queued[idx] and due == self.__due[idx]:
+                self.__queued[idx] = False
+                return idx
+        raise ValueError("No entry is waiting to be scheduled.")
+
+    def requeue(self, index: int):
+        """Puts a checked out entry back, keeping its due time."""
+        if self.__removed[index] or self.__queued[index]:
+            return
+        self.__queued[index] = True
+        heapq.heappush(self.__heap, (self.__due[index], index))
+
+    def record(self, index: int, correct: bool):
+        """Reschedules the entry at `index` after it was answered."""
+        if self.__removed[index]:
+            return
+
+        quality = CORRECT_QUALITY if correct else INCORRECT_QUALITY
+        ease = self.__ease[index] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        ease = max(ease, MIN_EASE)
+
+        if correct:
+            repetitions = self.__repetitions[index] + 1
+            interval = self._next_interval(self.__interval[index], repetitions, ease)
+        else:
+            # Failed entries start over, and come back after one interval
+            repetitions = 0
+            interval = 1.0
+
+        self.__repetitions[index] = repetitions
+        self.__ease[index] = ease
+        self.__interval[index] = interval
+        self.__due[index] = time.monotonic() + interval * INTERVAL_UNIT
+
+        self.__queued[index] = True
+        heapq.heappush(self.__heap, (self.__due[index], index))
+
+    def remove(self, index: int):
+        """Removes the entry at `index`, so it is never scheduled again."""
+        if self.__removed[index]:
+            return
+        self.__removed[index] = True
+        self.__queued[index] = False
+        self.__size -= 1
@@ -1,136 +1,621 @@
+from array import array
 from pathlib import Path
+import mmap
+import os
+import sys
 import tempfile
 import struct
+import zlib
+
+from typing import Iterable, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the struct module is used without it
+    np = None
 
 SCORE_LIFETIME = 0.95
 
-class Score:
-    """Internal data structure for vocabulary question score storage."""
-    def __init__(self, total: int = 0, correct: int = 0, streak: int = 0, score: float = 0.0):
-        self.correct = correct
-        self.total = total
-        self.streak = streak
-        self._score = score
+# Version 2 files start with a binary header: magic, version, record size, record count, and CRC-32 of the records.
+# All values are little-endian. Records are stored column by column: every total, every correct, every streak,
+# then every score, so that the columns of a table are written and read as they are.
+MAGIC = b"VOCS"
+VERSION = 2
+_HEADER = struct.Struct("<4sHHII")
+_HEADER_CRC_OFFSET = 12
+RECORD_SIZE = 20  # 4 bytes total, 4 bytes correct, 4 bytes streak, 8 bytes double
+_COUNTER = struct.Struct("<I")
+_SCORE = struct.Struct("<d")
+
+# Array type of the counter columns, 4 bytes on all common platforms
+_COUNTER_TYPECODE = "I"
+_COUNTER_MAX = 0xFFFFFFFF
+
+V1_HEADER = b"1\n"  # version header (text line)
+V1_RECORD_SIZE = 14  # 2 bytes total, 2 bytes correct, 2 bytes streak, 8 bytes double
+
+# Version 1 counters are big-endian, while the score double is little-endian
+_V1_RECORD = struct.Struct(">HHH8s")
+_V1_SEPARATED_RECORD = struct.Struct(">HHH8sx")
+
+if np is not None:
+    _V1_RECORD_DTYPE = np.dtype([("total", ">u2"), ("correct", ">u2"), ("streak", ">u2"), ("score", "<f8")])
+    _V1_SEPARATED_RECORD_DTYPE = np.dtype({
+        "names": ["total", "correct", "streak", "score"],
+        "formats": [">u2", ">u2", ">u2", "<f8"],
+        "offsets": [0, 2, 4, 6],
+        "itemsize": V1_RECORD_SIZE + 1,
+    })
+    _COUNTER_DTYPE = np.dtype(f"=u{array(_COUNTER_TYPECODE).itemsize}")
+
+# Number of records decoded at once when upgrading an older file
+UPGRADE_CHUNK_RECORDS = 4096
+
+# Journals start with a magic, followed by entries made of the index of the score and its values, little-endian.
+JOURNAL_MAGIC = b"VOCJ"
+_JOURNAL_ENTRY = struct.Struct("<IIIId")
+JOURNAL_ENTRY_SIZE = _JOURNAL_ENTRY.size
+
+# Number of journal entries after which the journal is merged into the score file
+JOURNAL_COMPACT_THRESHOLD = 256
+
+# Whether score files are mapped in memory to write updated scores in place, rather than to the journal
+MAP_SCORE_FILES = False
+
+# Highest score a question can reach, so that it keeps a chance to be asked
+SCORE_CAP = 0.95
+
+class ScoreTable:
+    """Columnar storage of scores, with one array per field.
     
+    Scores are handed out as `Score` views holding the table and an index.
+    Rows are only ever appended: to remove scores, fill a new table instead, views onto the old one stay valid.
+    """
+    def __init__(self):
+        self.total = array(_COUNTER_TYPECODE)
+        self.correct = array(_COUNTER_TYPECODE)
+        self.streak = array(_COUNTER_TYPECODE)
+        self.score = array("d")
+
+        # Incremented by every change of the rows
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def __getitem__(self, index: int) -> "Score":
+        if index < 0:
+            index += len(self.score)
+        if not 0 <= index < len(self.score):
+            raise IndexError("score table index out of range")
+        return Score._view(self, index)
+
+    def __iter__(self) -> Iterator["Score"]:
+        for index in range(len(self.score)):
+            yield Score._view(self, index)
+
+    def append_row(self, total: int = 0, correct: int = 0, streak: int = 0, score: float = 0.0) -> int:
+        """Appends a row and returns its index."""
+        self.generation += 1
+        self.total.append(total)
+        self.correct.append(correct)
+        self.streak.append(streak)
+        self.score.append(score)
+        return len(self.score) - 1
+
+    def append(self, score: "Score"):
+        """Appends the values of score, which becomes a view onto the new row."""
+        score._rebind(self, self.append_row(*score.values()))
+
+    def extend(self, scores: Iterable["Score"]):
+        """Appends the values of each score. Unlike `append`, the scores are not rebound."""
+        for score in scores:
+            self.append_row(*score.values())
+
+    def row(self, index: int) -> tuple[int, int, int, float]:
+        """Returns the total, correct, streak and score values of a row."""
+        return self.total[index], self.correct[index], self.streak[index], self.score[index]
+
+    def set_row(self, index: int, total: int, correct: int, streak: int, score: float):
+        """Sets the values of a row."""
+        self.total[index] = total
+        self.correct[index] = correct
+        self.streak[index] = streak
+        self.score[index] = score
+        self.generation += 1
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Score):
+        if not isinstance(other, ScoreTable):
             return False
         return (self.total == other.total and
                 self.correct == other.correct and
                 self.streak == other.streak and
-                self._score == other._score)
-    
+                self.score == other.score)
+
+class Score:
+    """Internal data structure for vocabulary question score storage.
+
+    A view onto a row of a `ScoreTable`. A score created on its own gets a table of its own.
+    """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, total: int = 0, correct: int = 0, streak: int = 0, score: float = 0.0):
+        self._table = ScoreTable()
+        self._index = self._table.append_row(total, correct, streak, score)
+
+    @classmethod
+    def _view(cls, table: ScoreTable, index: int) -> "Score":
+        """Returns a view onto a row of table."""
+        view = cls.__new__(cls)
+        view._table = table
+        view._index = index
+        return view
+
+    def _rebind(self, table: ScoreTable, index: int):
+        """Makes this score a view onto another row."""
+        self._table = table
+        self._index = index
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Score):
+            return False
+        return self.values() == other.values()
+
+    def values(self) -> tuple[int, int, int, float]:
+        """Returns the total, correct, streak and score values."""
+        return self._table.row(self._index)
+
+    @property
+    def total(self) -> int:
+        """Returns the number of answers."""
+        return self._table.total[self._index]
+
+    @property
+    def correct(self) -> int:
+        """Returns the number of correct answers."""
+        return self._table.correct[self._index]
+
+    @property
+    def streak(self) -> int:
+        """Returns the number of correct answers in a row."""
+        return self._table.streak[self._index]
+
+    @property
+    def _score(self) -> float:
+        return self._table.score[self._index]
+
     @property
     def score(self) -> float:
         """Calculates and returns the score based on total, correct, and streak."""
-        return min(self._score, 0.95)
+        return min(self._score, SCORE_CAP)
     
     @property
     def average(self) -> float:
         """Returns the average score (correct/total)."""
         return self._score
     
+    def reset(self):
+        """Resets the score in place, as if the question was never answered."""
+        self._table.set_row(self._index, 0, 0, 0, 0.0)
+
     def update(self, correct: bool):
         """Updates the score based on whether the answer was correct."""
-        self.total += 1
-        self._score = self._score * SCORE_LIFETIME
+        total, nb_correct, streak, score = self.values()
+        total = min(total + 1, _COUNTER_MAX)
+        score = score * SCORE_LIFETIME
         if correct:
-            self.correct += 1
-            self.streak += 1
-            self._score += (1.0 - SCORE_LIFETIME)
+            nb_correct = min(nb_correct + 1, _COUNTER_MAX)
+            streak = min(streak + 1, _COUNTER_MAX)
+            score += (1.0 - SCORE_LIFETIME)
         else:
-            self.streak = 0
-            
+            streak = 0
+        self._table.set_row(self._index, total, nb_correct, streak, score)
+
+def gather_averages(scores: Sequence[Score]) -> "list[float] | np.ndarray":
+    """Returns the average of each score, read from the score column of its table.
+    
+    Returned as a NumPy array if NumPy is available, so that further computations on them are vectorized."""
+    # Positions in scores and rows in the table of the scores of each table
+    groups: dict[int, tuple[ScoreTable, list[int], list[int]]] = {}
+    for position, score in enumerate(scores):
+        group = groups.get(id(score._table))
+        if group is None:
+            group = groups[id(score._table)] = (score._table, [], [])
+        group[1].append(position)
+        group[2].append(score._index)
+
+    if np is not None:
+        averages = np.empty(len(scores), dtype=np.float64)
+        for table, positions, rows in groups.values():
+            averages[positions] = np.frombuffer(table.score, dtype=np.float64)[rows]
+        return averages
+
+    result = [0.0] * len(scores)
+    for table, positions, rows in groups.values():
+        column = table.score
+        for position, row in zip(positions, rows):
+            result[position] = column[row]
+    return result
+
+
+def _columns(table: ScoreTable) -> tuple[array, array, array, array]:
+    return table.total, table.correct, table.streak, table.score
+
+def _snapshot_columns(table: ScoreTable) -> tuple[int, list[array]]:
+    """Returns the generation of table and copies of its columns.
+    
+    Safe to call while another thread changes the table, in which case some rows may be torn,
+    but the returned generation is never more recent than the copies."""
+    generation = table.generation
+    n = len(table)
+    return generation, [column[:n] for column in _columns(table)]
+
+def _encode_column(column: array, fmt: str) -> array | bytes:
+    """Returns the little-endian encoding of a column, with items of the struct format fmt."""
+    if column.itemsize == struct.calcsize(fmt):
+        if sys.byteorder == "little":
+            return column  # written as is
+        swapped = array(column.typecode, column)
+        swapped.byteswap()
+        return swapped
+    return struct.pack(f"<{len(column)}{fmt}", *column)
+
+def _decode_column(column: array, data: bytes | memoryview, fmt: str):
+    """Appends the values of a little-endian encoded column of struct format fmt."""
+    if column.itemsize == struct.calcsize(fmt):
+        if sys.byteorder == "little":
+            column.frombytes(data)
+        else:
+            values = array(column.typecode, bytes(data))
+            values.byteswap()
+            column.extend(values)
+        return
+    column.extend(struct.unpack(f"<{len(data) // struct.calcsize(fmt)}{fmt}", data))
+
+def _encode_records(columns: Iterable[array]) -> list[array | bytes]:
+    """Encodes the columns of scores as version 2 records, one buffer per column."""
+    return [_encode_column(column, fmt) for column, fmt in zip(columns, "IIId")]
+
+def _decode_records(table: ScoreTable, data: bytes | memoryview):
+    """Appends scores decoded from version 2 records."""
+    n = len(data) // RECORD_SIZE
+    with memoryview(data) as view:
+        _decode_column(table.total, view[:4 * n], "I")
+        _decode_column(table.correct, view[4 * n:8 * n], "I")
+        _decode_column(table.streak, view[8 * n:12 * n], "I")
+        _decode_column(table.score, view[12 * n:], "d")
+
+# Reflected polynomial of CRC-32, and x ** (2 ** k) modulo it for each k, as used by zlib's crc32_combine
+_CRC_POLY = 0xEDB88320
+_CRC_X2N = [1 << 30]
+
+def _crc_multiply(a: int, b: int) -> int:
+    """Returns the product of two polynomials modulo the CRC-32 polynomial, in the reflected bit order."""
+    m = 1 << 31
+    p = 0
+    while True:
+        if a & m:
+            p ^= b
+            if a & (m - 1) == 0:
+                return p
+        m >>= 1
+        b = (b >> 1) ^ _CRC_POLY if b & 1 else b >> 1
+
+for _ in range(31):
+    _CRC_X2N.append(_crc_multiply(_CRC_X2N[-1], _CRC_X2N[-1]))
+
+def _crc_replace(crc: int, old: bytes, new: bytes, after: int) -> int:
+    """Returns the CRC-32 of data of checksum crc whose bytes old, followed by after other bytes, were replaced by new.
+    
+    Takes O(len(old) + log(after)) rather than a pass over the data: the checksum changes by the one of the difference,
+    shifted by the bytes after it."""
+    difference = bytes(a ^ b for a, b in zip(old, new))
+    change = zlib.crc32(difference, 0xFFFFFFFF) ^ 0xFFFFFFFF
+    n, k = after, 3  # x ** (8 * after)
+    while n and change:
+        if n & 1:
+            change = _crc_multiply(_CRC_X2N[k & 31], change)
+        n >>= 1
+        k += 1
+    return crc ^ change
+
+def _decode_v1_records(table: ScoreTable, data: bytes, separated: bool = False):
+    """Appends scores decoded in bulk from consecutive version 1 records.
+    
+    If separated, each record is followed by a separator byte."""
+    if np is not None:
+        records = np.frombuffer(data, dtype=_V1_SEPARATED_RECORD_DTYPE if separated else _V1_RECORD_DTYPE)
+        table.total.frombytes(records["total"].astype(_COUNTER_DTYPE).tobytes())
+        table.correct.frombytes(records["correct"].astype(_COUNTER_DTYPE).tobytes())
+        table.streak.frombytes(records["streak"].astype(_COUNTER_DTYPE).tobytes())
+        table.score.frombytes(records["score"].astype("=f8").tobytes())
+        return
+
+    unpacked = list((_V1_SEPARATED_RECORD if separated else _V1_RECORD).iter_unpack(data))
+    table.total.extend(record[0] for record in unpacked)
+    table.correct.extend(record[1] for record in unpacked)
+    table.streak.extend(record[2] for record in unpacked)
+    # Decode all the doubles at once
+    scores = array("d", b"".join(record[3] for record in unpacked))
+    if sys.byteorder != "little":
+        scores.byteswap()
+    table.score.extend(scores)
+
 
 class ScoreFile:
     """Handles loading and saving of vocabulary score files."""
     
-    def __init__(self, folder: Path, name: str, scores: list[Score] | None = None):
+    def __init__(self, folder: Path, name: str, scores: ScoreTable | list[Score] | None = None):
         self.__folder = folder
         self.__name = name
         self.__filepath = self._filepath_for_name(name)
-        self.scores: list[Score] = scores if scores is not None else []
+        self.__journal_path = self._journal_path_for_name(name)
+        if isinstance(scores, ScoreTable):
+            self.scores = scores
+        else:
+            self.scores = ScoreTable()
+            self.scores.extend(scores or [])
+
+        # Number of scores in the file on disk, format version of that file, and number of entries in its journal
+        self.__saved_length = 0
+        self.__saved_version = VERSION
+        self.__journal_entries = 0
+        # Whether scores were added by `pad` and are not on disk yet
+        self.__padded = False
+        # Table and generation of the scores on disk, None if they were never loaded or saved
+        self.__saved_table: ScoreTable | None = None
+        self.__saved_generation = 0
+        # Memory map of the file, and the table whose rows it holds
+        self.__mapping: mmap.mmap | None = None
+        self.__mapped_table: ScoreTable | None = None
     
     def _filepath_for_name(self, name: str) -> Path:
         return self.__folder / f"{name}.voc_score"
 
+    def _journal_path_for_name(self, name: str) -> Path:
+        return self.__folder / f"{name}.voc_score_journal"
+
     @classmethod
     def load(cls, folder: Path, name: str) -> "ScoreFile":
-        """Loads a vocabulary score file."""
+        """Loads a vocabulary score file, and replays its journal."""
+        score_file = cls._load_main(folder, name)
+        score_file.__saved_length = len(score_file.scores)
+        score_file._replay_journal()
+        if score_file.__filepath.exists():
+            score_file._mark_saved(score_file.scores, score_file.scores.generation)
+        return score_file
+
+    def pad(self, length: int) -> bool:
+        """Appends new scores until there are length scores. Returns True if scores were added.
+        
+        New scores are the same as missing ones, so the file is still considered saved.
+        They are written by the next save or compaction."""
+        if len(self.scores) >= length:
+            return False
+        saved = (self.scores is self.__saved_table and self.scores.generation == self.__saved_generation
+                 or self.__saved_table is None and not self.__filepath.exists())
+        while len(self.scores) < length:
+            self.scores.append_row()
+        if saved:
+            self.__padded = True
+            self._mark_saved(self.scores, self.scores.generation)
+        return True
+
+    def _mark_saved(self, table: ScoreTable, generation: int):
+        """Marks the scores of table at generation as the ones on disk."""
+        self.__saved_table = table
+        self.__saved_generation = generation
+
+    def _replay_journal(self):
+        """Applies the score updates of the journal, ignoring a torn last entry."""
+        if not self.__journal_path.exists():
+            return
+
+        with open(self.__journal_path, "rb") as f:
+            data = f.read()
+        if len(data) >= len(JOURNAL_MAGIC) and not data.startswith(JOURNAL_MAGIC):
+            raise ValueError(f"Invalid vocabulary score journal {self.__journal_path}")
+
+        body = data[len(JOURNAL_MAGIC):]
+        body = body[:len(body) - len(body) % JOURNAL_ENTRY_SIZE]
+        n = 0
+        for idx, *values in _JOURNAL_ENTRY.iter_unpack(body):
+            if idx < len(self.scores):
+                self.scores.set_row(idx, *values)
+            n += 1
+        self.__journal_entries = n
+
+    @classmethod
+    def _load_main(cls, folder: Path, name: str) -> "ScoreFile":
+        """Loads a vocabulary score file, without its journal. Older versions are upgraded to version 2."""
         
         score_file = cls(folder, name)
         filepath = score_file.__filepath
 
-        # Binary files encoding with version header
-
         if not filepath.exists():
             return score_file  # no scores yet
 
-        # Read header line (text) then read the remaining binary block
         with open(filepath, "rb") as f:
-            header = f.readline()
+            header = f.read(_HEADER.size)
             if not header:
                 return score_file
-            version = header.strip().decode("utf-8")
+            if header.startswith(MAGIC):
+                data = f.read()
+
+        if not header.startswith(MAGIC):
+            # Text version line of older files
+            version = header.split(b"\n", 1)[0].strip().decode("utf-8")
             if version == "0":
-                return ScoreFile0.load(folder, name).upgrade_to_1()
-            if version != "1":
+                score_file = ScoreFile0.load(folder, name).upgrade_to_1().upgrade_to_2()
+            elif version == "1":
+                score_file = ScoreFile1.load(folder, name).upgrade_to_2()
+            else:
                 raise ValueError(f"Unsupported vocabulary score file version: {version}")
+            score_file.__saved_version = int(version)
+            return score_file
 
-            data = f.read()
+        # Validate the header and checksum, then decode the columns in one pass
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Truncated vocabulary score file header in {filepath}")
+        _, version, record_size, count, crc = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported vocabulary score file version: {version}")
+        if record_size != RECORD_SIZE:
+            raise ValueError(f"Unexpected record size {record_size} in {filepath}")
+        if len(data) != count * RECORD_SIZE:
+            raise ValueError(f"Expected {count} records in {filepath}, found {len(data) / RECORD_SIZE:g}")
+        if zlib.crc32(data) != crc:
+            raise ValueError(f"Checksum mismatch in {filepath}")
+
+        _decode_records(score_file.scores, data)
+        return score_file
+    
+    def _position(self, score: Score) -> int | None:
+        """Returns the position of score in the table, or None if it is not a view onto it."""
+        if score._table is not self.scores or score._index >= len(self.scores):
+            return None
+        return score._index
+
+    def clear(self):
+        """Removes all scores. Existing scores keep their values, but are no longer part of the file."""
+        if self.__mapped_table is self.scores:
+            self.unmap()
+        self.scores = ScoreTable()
+
+    def _in_sync(self) -> bool:
+        """Checks if the file on disk has the same scores, in the same order, as the table."""
+        if self._filepath_for_name(self.__name) != self.__filepath:
+            return False
+        # A table that replaced the saved one may have the same length, but other scores in its rows
+        if self.scores is not self.__saved_table:
+            return False
+        return len(self.scores) == self.__saved_length and self.__filepath.exists()
 
-        RECORD_SIZE = 14  # 2 bytes total, 2 bytes correct, 2 bytes streak, 8 bytes double
+    def map(self) -> bool:
+        """Maps the score file in memory, so that recorded score updates are written in place to their record.
 
-        def _parse_chunk(chunk: bytes):
-            total = int.from_bytes(chunk[0:2], byteorder="big")
-            correct = int.from_bytes(chunk[2:4], byteorder="big")
-            streak = int.from_bytes(chunk[4:6], byteorder="big")
-            score_val = struct.unpack('<d', chunk[6:14])[0]
-            return Score(total, correct, streak, score_val)
+        Returns False if the file can not be mapped, as it is not a version 2 file in sync with the scores.
+        """
+        if self.__mapping is not None:
+            return True
+        if not self._in_sync() or self.__journal_entries > 0 or len(self.scores) == 0:
+            return False
 
-        # Prefer the new contiguous-record format (multiple of RECORD_SIZE).
-        if len(data) % RECORD_SIZE == 0:
-            for i in range(len(data) // RECORD_SIZE):
-                chunk = data[i * RECORD_SIZE:(i + 1) * RECORD_SIZE]
-                score_file.scores.append(_parse_chunk(chunk))
-            return score_file
+        try:
+            with open(self.__filepath, "r+b") as f:
+                magic, version, record_size, count, _ = _HEADER.unpack(f.read(_HEADER.size))
+                if (magic, version, record_size, count) != (MAGIC, VERSION, RECORD_SIZE, len(self.scores)):
+                    return False
+                if os.fstat(f.fileno()).st_size != _HEADER.size + RECORD_SIZE * len(self.scores):
+                    return False
+                mapping = mmap.mmap(f.fileno(), 0)
+        except (OSError, ValueError, struct.error):
+            return False
 
-        # Fallback: old files used a newline after each record (15 bytes per record).
-        sep_size = RECORD_SIZE + 1
-        if len(data) % sep_size == 0:
-            # likely newline-separated records
-            for i in range(len(data) // sep_size):
-                rec = data[i * sep_size:(i + 1) * sep_size]
-                # take first RECORD_SIZE bytes and ignore separator
-                chunk = rec[:RECORD_SIZE]
-                score_file.scores.append(_parse_chunk(chunk))
-            return score_file
+        self.__mapping = mapping
+        self.__mapped_table = self.scores
+        return True
 
-        # Last resort: remove newline bytes and try to parse contiguous records
-        cleaned = data.replace(b"\n", b"")
-        if len(cleaned) % RECORD_SIZE == 0 and len(cleaned) > 0:
-            for i in range(len(cleaned) // RECORD_SIZE):
-                chunk = cleaned[i * RECORD_SIZE:(i + 1) * RECORD_SIZE]
-                score_file.scores.append(_parse_chunk(chunk))
-            return score_file
+    def unmap(self) -> bool:
+        """Flushes and unmaps the score file. Returns True if it was mapped."""
+        mapping = self.__mapping
+        if mapping is None:
+            return False
 
-        # If still malformed, parse as many full records as possible and warn
-        if len(cleaned) >= RECORD_SIZE:
-            n = len(cleaned) // RECORD_SIZE
-            for i in range(n):
-                chunk = cleaned[i * RECORD_SIZE:(i + 1) * RECORD_SIZE]
-                score_file.scores.append(_parse_chunk(chunk))
-            leftover = len(cleaned) - n * RECORD_SIZE
-            if leftover:
-                print(f"Warning: skipping {leftover} trailing bytes in {filepath}")
-            return score_file
+        self.__mapped_table = None
+        self.__mapping = None
+
+        mapping.flush()
+        mapping.close()
+        return True
+
+    def record(self, score: Score) -> bool:
+        """Persists an update of a single score, without rewriting the file.
+
+        The update is written in place if the file is mapped, otherwise it is appended to the journal.
+        The update has to be the last change of the scores.
+        Returns False if this is not possible because the file on disk does not have the same scores,
+        or is in an older version, in which case the file should be saved instead.
+        """
+        if not self._in_sync() or self.__saved_version != VERSION:
+            return False
+
+        if MAP_SCORE_FILES and self.__mapping is None:
+            self.compact()
+            self.map()
+        idx = self._position(score)
+        if idx is None:
+            return False
+        generation = self.scores.generation
+        if self.__mapping is not None and self.__mapped_table is self.scores:
+            self._write_mapped(idx)
+        else:
+            with open(self.__journal_path, "ab") as f:
+                size = f.tell()
+                if size < len(JOURNAL_MAGIC):
+                    # New journal, or one whose magic was torn
+                    f.truncate(0)
+                    f.write(JOURNAL_MAGIC)
+                elif torn := (size - len(JOURNAL_MAGIC)) % JOURNAL_ENTRY_SIZE:
+                    # Drop an entry torn by an interrupted write, so the next entries stay aligned
+                    f.truncate(size - torn)
+                f.write(_JOURNAL_ENTRY.pack(idx, *self.scores.row(idx)))
+            self.__journal_entries += 1
+
+        # Still saved if the recorded update is the only change since the last save
+        if self.scores is self.__saved_table and generation == self.__saved_generation + 1:
+            self._mark_saved(self.scores, generation)
+
+        if self.__journal_entries >= JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+        return True
+
+    def _write_mapped(self, index: int):
+        """Writes a row of the scores to its record in the mapped file, and updates the file checksum in place."""
+        mapping = self.__mapping
+        assert mapping is not None
+        n = len(self.scores)
+        end = _HEADER.size + RECORD_SIZE * n
+        crc = _COUNTER.unpack_from(mapping, _HEADER_CRC_OFFSET)[0]
+        total, correct, streak, score = self.scores.row(index)
+        for position, value in (
+            (_HEADER.size + 4 * index, _COUNTER.pack(total)),
+            (_HEADER.size + 4 * (n + index), _COUNTER.pack(correct)),
+            (_HEADER.size + 4 * (2 * n + index), _COUNTER.pack(streak)),
+            (_HEADER.size + 12 * n + 8 * index, _SCORE.pack(score)),
+        ):
+            stop = position + len(value)
+            crc = _crc_replace(crc, mapping[position:stop], value, end - stop)
+            mapping[position:stop] = value
+        _COUNTER.pack_into(mapping, _HEADER_CRC_OFFSET, crc)
+
+    def compact(self):
+        """Merges the journal into the score file, and flushes in place updates.
+        
+        Files loaded from an older version are rewritten in the current one, and padded files with their new scores.
+        Only what is on disk is written, at its current path: unsaved changes and renames are left to `save`."""
+        if self.__mapping is not None:
+            self.__mapping.flush()
+        if self.check_saved():
+            if self.__journal_entries > 0 or self.__saved_version != VERSION or self.__padded:
+                self.save()
+        elif self.__journal_entries > 0:
+            # Merge the journal from disk, without the changes in memory
+            saved_file = ScoreFile.load(self.__folder, self.__filepath.name[:-len(".voc_score")])
+            saved_file.save()
+            self.__journal_entries = 0
+            self.__saved_version = VERSION
 
-        # Nothing parseable
-        return score_file
-    
     def save(self):
-        """Saves the vocabulary score file to its filepath."""
+        """Saves the vocabulary score file to its filepath.
+        
+        The scores are copied first, so they may be changed by another thread during the save."""
+        table = self.scores
+        generation, snapshot = _snapshot_columns(table)
+
+        # The file is replaced, so it has to be remapped afterwards
+        was_mapped = self.unmap()
+
         # Renames if needed
         new_filepath = self._filepath_for_name(self.__name)
         if new_filepath != self.__filepath:
@@ -140,50 +625,80 @@ class ScoreFile:
                 pass
             self.__filepath = new_filepath
 
+        if self.__saved_version != VERSION and self.__filepath.exists():
+            print(f"Upgrading score file {self.__filepath.name} from version {self.__saved_version} to version {VERSION}")
+
+        n = len(snapshot[-1])
+        columns = _encode_records(snapshot)
+        crc = 0
+        for column in columns:
+            crc = zlib.crc32(column, crc)
         with tempfile.NamedTemporaryFile("wb", dir=self.__filepath.parent, delete=False) as f:
-            f.write(b"1\n")  # version header (text line)
-            for s in self.scores:
-                total_bytes = s.total.to_bytes(2, byteorder="big")
-                correct_bytes = s.correct.to_bytes(2, byteorder="big")
-                streak_bytes = s.streak.to_bytes(2, byteorder="big")
-                score_bytes = struct.pack('<d', s.score)
-                # write each record as contiguous 14 bytes (no newline separators)
-                f.write(total_bytes + correct_bytes + streak_bytes + score_bytes)
+            f.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE, n, crc))
+            for column in columns:
+                f.write(column)
             f.flush()
             temp_name = f.name
         # Move temp file to final location
         temp_path = Path(temp_name)
         temp_path.replace(self.__filepath)
 
-    def check_saved(self) -> bool:
-        """Checks if the current in-memory scores match the saved file."""
-        if not self.__filepath.exists():
+        # The journal is now part of the file
+        try:
+            self.__journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        self.__journal_path = self._journal_path_for_name(self.__name)
+        self.__saved_length = n
+        self.__saved_version = VERSION
+        self.__journal_entries = 0
+        self.__padded = False
+        self._mark_saved(table, generation)
+
+        if was_mapped:
+            self.map()
+
+    def check_saved(self, verify: bool = False) -> bool:
+        """Checks if the current in-memory scores match the saved file.
+        
+        Only checks that the scores did not change since they were loaded or saved,
+        unless verify is True, in which case the file is loaded and compared."""
+        if not verify:
+            if self.scores is not self.__saved_table or self.scores.generation != self.__saved_generation:
+                return False
+            if self.__padded:
+                return self._filepath_for_name(self.__name) == self.__filepath
+            return self._in_sync()
+
+        if not self.__filepath.exists() and not self.__padded:
             return False
         
         try:
             saved_file = ScoreFile.load(self.__folder, self.__name)
         except:
             return False
+        if self.__padded:
+            saved_file.pad(len(self.scores))
         return self == saved_file
 
     def delete(self):
         """Deletes the vocabulary score file."""
+        self.unmap()
         try:
             self.__filepath.unlink()
         except:
             pass
+        try:
+            self.__journal_path.unlink()
+        except:
+            pass
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ScoreFile):
             return False
         if self.__name != other.__name:
             return False
-        if len(self.scores) != len(other.scores):
-            return False
-        for a, b in zip(self.scores, other.scores):
-            if a != b:
-                return False
-        return True
+        return self.scores == other.scores
 
     @property
     def name(self) -> str:
@@ -223,25 +738,23 @@ class ScoreFile0:
             return score_file  # no scores yet
 
         with open(filepath, "rb") as f:
-            lines = f.readlines()
-
-        version = lines[0].strip().decode("utf-8")
-        if version != "0":
-            raise ValueError(f"Unsupported vocabulary score file version: {version}")
-        
-        for line in lines[1:]:
-            # line = line.strip() # Causes problems
-            # Each line is 3 16 bits binary integers: total, correct, streak with no separator
-            if len(line) != 7: # 2 bytes * 3 + 1 byte newline
-                print(f"Warning: skipping malformed line in {filepath}: {line}")
-                continue
-
-            total = int.from_bytes(line[0:2], byteorder="big")
-            correct = int.from_bytes(line[2:4], byteorder="big")
-            streak = int.from_bytes(line[4:6], byteorder="big")
-
-            score = Score(total, correct, streak)
-            score_file.scores.append(score)
+            version = f.readline().strip().decode("utf-8")
+            if version != "0":
+                raise ValueError(f"Unsupported vocabulary score file version: {version}")
+            
+            for line in f:
+                # line = line.strip() # Causes problems
+                # Each line is 3 16 bits binary integers: total, correct, streak with no separator
+                if len(line) != 7: # 2 bytes * 3 + 1 byte newline
+                    print(f"Warning: skipping malformed line in {filepath}: {line}")
+                    continue
+
+                total = int.from_bytes(line[0:2], byteorder="big")
+                correct = int.from_bytes(line[2:4], byteorder="big")
+                streak = int.from_bytes(line[4:6], byteorder="big")
+
+                score = Score(total, correct, streak)
+                score_file.scores.append(score)
         
         return score_file
 
@@ -255,11 +768,74 @@ class ScoreFile0:
         """Renames the vocabulary score file."""
         self.__name = new_name
     
-    def upgrade_to_1(self) -> ScoreFile:
+    def upgrade_to_1(self) -> "ScoreFile1":
         """Upgrades this score file to version 1."""
-        print(f"Upgrading score file {self.__filepath.name} to version 1")
-        new_scores: list[Score] = []
+        new_scores = ScoreTable()
         for s in self.scores:
-            new_score = Score(s.total, s.correct, s.streak, s.correct / s.total if s.total > 0 else 0.0)
-            new_scores.append(new_score)
-        return ScoreFile(self.__folder, self.__name, new_scores)
\ No newline at end of file
+            new_scores.append_row(s.total, s.correct, s.streak, s.correct / s.total if s.total > 0 else 0.0)
+        return ScoreFile1(self.__folder, self.__name, new_scores)
+
+
+class ScoreFile1:
+    """Updates from version 1 to 2"""
+    
+    def __init__(self, folder: Path, name: str, scores: ScoreTable | None = None):
+        self.__folder = folder
+        self.__name = name
+        self.__filepath = self._filepath_for_name(name)
+        self.scores = scores if scores is not None else ScoreTable()
+    
+    def _filepath_for_name(self, name: str) -> Path:
+        return self.__folder / f"{name}.voc_score"
+
+    @classmethod
+    def load(cls, folder: Path, name: str) -> "ScoreFile1":
+        """Loads a vocabulary score file, decoding its records in chunks."""
+        
+        score_file = cls(folder, name)
+        filepath = score_file.__filepath
+
+        if not filepath.exists():
+            return score_file  # no scores yet
+
+        with open(filepath, "rb") as f:
+            header = f.readline()
+            if not header:
+                return score_file
+            version = header.strip().decode("utf-8")
+            if version != "1":
+                raise ValueError(f"Unsupported vocabulary score file version: {version}")
+
+            size = os.fstat(f.fileno()).st_size - f.tell()
+
+            # Contiguous records, or older files with a newline after each record (ignored)
+            for record_size, separated in ((V1_RECORD_SIZE, False), (V1_RECORD_SIZE + 1, True)):
+                if size % record_size == 0:
+                    while chunk := f.read(record_size * UPGRADE_CHUNK_RECORDS):
+                        _decode_v1_records(score_file.scores, chunk, separated)
+                    return score_file
+
+            data = f.read()
+
+        # Last resort: remove newline bytes and parse as many full records as possible
+        cleaned = data.replace(b"\n", b"")
+        n = len(cleaned) // V1_RECORD_SIZE
+        _decode_v1_records(score_file.scores, cleaned[:n * V1_RECORD_SIZE])
+        leftover = len(cleaned) - n * V1_RECORD_SIZE
+        if leftover:
+            print(f"Warning: skipping {leftover} trailing bytes in {filepath}")
+        return score_file
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the vocabulary score file."""
+        return self.__name
+    
+    @name.setter
+    def name(self, new_name: str):
+        """Renames the vocabulary score file."""
+        self.__name = new_name
+    
+    def upgrade_to_2(self) -> ScoreFile:
+        """Upgrades this score file to version 2. The values are the same, only the encoding changes."""
+        return ScoreFile(self.__folder, self.__name, self.scores)
\ No newline at end of file
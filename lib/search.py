@@ -0,0 +1,175 @@
+"""Search of questions and answers across all vocabulary sets, with a persisted trigram index."""
+
+from pathlib import Path
+import json
+import tempfile
+
+from typing import Iterable, NamedTuple, Protocol
+
+from lib.normalization import normalize, options as normalization_options
+
+SEARCH_INDEX_VERSION = 1
+
+# Maximum number of results of a search
+MAX_RESULTS = 200
+
+
+class Searchable(Protocol):
+    """A set that can be indexed: its content stamp changes whenever its questions do."""
+    @property
+    def name(self) -> str: ...
+    def content_stamp(self) -> tuple[int, ...] | None: ...
+    def question_pairs(self) -> list[tuple[str, str]]: ...
+
+
+class SearchHit(NamedTuple):
+    """A question matching a search, with the name of its set and its row in it."""
+    set_name: str
+    row: int
+    question: str
+    answer: str
+
+
+def trigrams(key: str) -> set[str]:
+    """Returns the trigrams of a normalized string, padded with spaces so that short strings have some."""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Inverted index from the trigrams of the normalized questions and answers to the rows containing them.
+
+    Each set is indexed with its content stamp, and only indexed again once its stamp changes.
+    A search intersects the rows of the trigrams of the query, then checks the candidates.
+    """
+    def __init__(self, path: Path):
+        self.__path = path
+        self.__options = list(normalization_options())
+        # Set name -> (content stamp, question and answer of each row)
+        self.__sets: dict[str, tuple[list[int], list[tuple[str, str]]]] = {}
+        # Trigram -> set name -> rows of the set containing it, in increasing order
+        self.__postings: dict[str, dict[str, list[int]]] = {}
+        self.__changed = False
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        """Loads the index file. A missing or unreadable index, or one of other normalization options, is empty."""
+        index = cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SEARCH_INDEX_VERSION or data.get("options") != index.__options:
+                return index
+            for name, (stamp, rows) in data["sets"].items():
+                index.__sets[name] = (stamp, [(question, answer) for question, answer in rows])
+            index.__postings = data["postings"]
+        except (OSError, ValueError, KeyError, TypeError):
+            index.__sets.clear()
+            index.__postings.clear()
+        return index
+
+    def save(self):
+        """Saves the index file, if it changed."""
+        if not self.__changed:
+            return
+        data = {
+            "version": SEARCH_INDEX_VERSION,
+            "options": self.__options,
+            "sets": self.__sets,
+            "postings": self.__postings,
+        }
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self.__path.parent, encoding="utf-8", delete=False) as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            temp_name = f.name
+        Path(temp_name).replace(self.__path)
+        self.__changed = False
+
+    def refresh(self, sets: Iterable[Searchable]):
+        """Indexes the sets whose content changed since they were indexed, and forgets the sets not in sets."""
+        if list(normalization_options()) != self.__options:
+            # The trigrams of the indexed rows are those of the old options, rebuild everything
+            self.__options = list(normalization_options())
+            self.__sets.clear()
+            self.__postings.clear()
+            self.__changed = True
+
+        names: set[str] = set()
+        for qset in sets:
+            stamp = qset.content_stamp()
+            if stamp is None:
+                continue
+            names.add(qset.name)
+            indexed = self.__sets.get(qset.name)
+            if indexed is None or indexed[0] != list(stamp):
+                self.__remove(qset.name)
+                self.__add(qset.name, list(stamp), qset.question_pairs())
+
+        for name in list(self.__sets):
+            if name not in names:
+                self.__remove(name)
+
+    def __add(self, name: str, stamp: list[int], rows: list[tuple[str, str]]):
+        self.__sets[name] = (stamp, rows)
+        for row, (question, answer) in enumerate(rows):
+            for gram in trigrams(normalize(question)) | trigrams(normalize(answer)):
+                self.__postings.setdefault(gram, {}).setdefault(name, []).append(row)
+        self.__changed = True
+
+    def __remove(self, name: str):
+        indexed = self.__sets.pop(name, None)
+        if indexed is None:
+            return
+        grams: set[str] = set()
+        for question, answer in indexed[1]:
+            grams |= trigrams(normalize(question)) | trigrams(normalize(answer))
+        for gram in grams:
+            postings = self.__postings.get(gram)
+            if postings is not None:
+                postings.pop(name, None)
+                if not postings:
+                    del self.__postings[gram]
+        self.__changed = True
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[SearchHit]:
+        """Returns the rows whose normalized question or answer contains the normalized query."""
+        key = normalize(query)
+        if not key:
+            return []
+
+        if len(key) >= 3:
+            # The rows containing the query contain all of its trigrams
+            grams = sorted((key[i:i + 3] for i in range(len(key) - 2)), key=lambda gram: len(self.__postings.get(gram, ())))
+            candidates: dict[str, set[int]] | None = None
+            for gram in grams:
+                postings = self.__postings.get(gram, {})
+                if candidates is None:
+                    candidates = {name: set(rows) for name, rows in postings.items()}
+                else:
+                    candidates = {
+                        name: rows & set(postings[name])
+                        for name, rows in candidates.items() if name in postings
+                    }
+                if not candidates:
+                    return []
+            assert candidates is not None
+        else:
+            # Too short for a trigram of its own, the rows containing it contain a trigram containing it
+            candidates = {}
+            for gram, postings in self.__postings.items():
+                if key in gram:
+                    for name, rows in postings.items():
+                        candidates.setdefault(name, set()).update(rows)
+
+        hits: list[SearchHit] = []
+        for name in candidates:
+            if name not in self.__sets:
+                continue
+            rows = self.__sets[name][1]
+            for row in sorted(candidates[name]):
+                question, answer = rows[row]
+                if key in normalize(question) or key in normalize(answer):
+                    hits.append(SearchHit(name, row, question, answer))
+                    if len(hits) >= limit:
+                        return hits
+        return hits
@@ -8,6 +8,14 @@ class Settings:
         self.__theme = "default"
         self.__score_momory = 5
         self.__insistence_exponent = 2.0
+        self.__prefetch = True
+        self.__scheduler = "weighted"
+        self.__map_score_files = False
+        self.__storage = "files"
+        self.__fold_spelling = False
+        self.__strip_articles = False
+        self.__typo_tolerance = 1
+        self.__live_feedback = False
     
     def save(self):
         """Saves the settings to the settings file."""
@@ -43,6 +51,38 @@ class Settings:
     def insistence_exponent(self) -> float:
         """Returns the current insistence exponent setting."""
         return self.__insistence_exponent
+    @property
+    def prefetch(self) -> bool:
+        """Returns whether the next question is prepared while answering."""
+        return self.__prefetch
+    @property
+    def scheduler(self) -> str:
+        """Returns the current question scheduler setting."""
+        return self.__scheduler
+    @property
+    def map_score_files(self) -> bool:
+        """Returns whether answers are written in place in memory-mapped score files."""
+        return self.__map_score_files
+    @property
+    def storage(self) -> str:
+        """Returns where the vocabulary sets are kept."""
+        return self.__storage
+    @property
+    def fold_spelling(self) -> bool:
+        """Returns whether answers are accepted with ss for ß and ae, oe, ue for ä, ö, ü."""
+        return self.__fold_spelling
+    @property
+    def strip_articles(self) -> bool:
+        """Returns whether answers are accepted without their leading article."""
+        return self.__strip_articles
+    @property
+    def typo_tolerance(self) -> int:
+        """Returns the number of typos for which an answer is reported as almost correct."""
+        return self.__typo_tolerance
+    @property
+    def live_feedback(self) -> bool:
+        """Returns whether the answer being typed is checked at each keystroke."""
+        return self.__live_feedback
 
     @theme.setter
     def theme(self, new_theme: str):
@@ -58,6 +98,39 @@ class Settings:
         """Sets the insistence exponent setting."""
         self.__insistence_exponent = new_exponent
 
+    @prefetch.setter
+    def prefetch(self, new_prefetch: bool):
+        """Sets the prefetch setting."""
+        self.__prefetch = new_prefetch
+    @scheduler.setter
+    def scheduler(self, new_scheduler: str):
+        """Sets the question scheduler setting."""
+        self.__scheduler = new_scheduler
+    @map_score_files.setter
+    def map_score_files(self, new_map_score_files: bool):
+        """Sets the score file mapping setting."""
+        self.__map_score_files = new_map_score_files
+    @storage.setter
+    def storage(self, new_storage: str):
+        """Sets the storage setting."""
+        self.__storage = new_storage
+    @fold_spelling.setter
+    def fold_spelling(self, new_fold_spelling: bool):
+        """Sets the spelling folding setting."""
+        self.__fold_spelling = new_fold_spelling
+    @strip_articles.setter
+    def strip_articles(self, new_strip_articles: bool):
+        """Sets the article stripping setting."""
+        self.__strip_articles = new_strip_articles
+    @typo_tolerance.setter
+    def typo_tolerance(self, new_typo_tolerance: int):
+        """Sets the typo tolerance setting."""
+        self.__typo_tolerance = new_typo_tolerance
+    @live_feedback.setter
+    def live_feedback(self, new_live_feedback: bool):
+        """Sets the live feedback setting."""
+        self.__live_feedback = new_live_feedback
+
     def edit_theme(self, new_theme: str):
         """Edits the theme setting."""
         self.__theme = new_theme
@@ -70,6 +143,38 @@ class Settings:
         """Edits the insistence exponent setting."""
         self.__insistence_exponent = new_insistence_exponent
 
+    def edit_prefetch(self, new_prefetch: bool):
+        """Edits the prefetch setting."""
+        self.__prefetch = new_prefetch
+
+    def edit_scheduler(self, new_scheduler: str):
+        """Edits the question scheduler setting."""
+        self.__scheduler = new_scheduler
+
+    def edit_map_score_files(self, new_map_score_files: bool):
+        """Edits the score file mapping setting."""
+        self.__map_score_files = new_map_score_files
+
+    def edit_storage(self, new_storage: str):
+        """Edits the storage setting."""
+        self.__storage = new_storage
+
+    def edit_fold_spelling(self, new_fold_spelling: bool):
+        """Edits the spelling folding setting."""
+        self.__fold_spelling = new_fold_spelling
+
+    def edit_strip_articles(self, new_strip_articles: bool):
+        """Edits the article stripping setting."""
+        self.__strip_articles = new_strip_articles
+
+    def edit_typo_tolerance(self, new_typo_tolerance: int):
+        """Edits the typo tolerance setting."""
+        self.__typo_tolerance = new_typo_tolerance
+
+    def edit_live_feedback(self, new_live_feedback: bool):
+        """Edits the live feedback setting."""
+        self.__live_feedback = new_live_feedback
+
     def needs_saving(self):
         """Indicates whether the settings are saved or not."""
         loaded_settings = self.load()
@@ -0,0 +1,136 @@
+"""Storage of all vocabulary sets and their scores in a single SQLite database."""
+
+from pathlib import Path
+import itertools
+import sqlite3
+import threading
+
+from typing import Iterable
+
+STORE_PATH = Path.cwd() / "data" / "vocabulary.sqlite3"
+
+# Question, answer, total, correct, streak and score of a question
+Row = tuple[str, str, int, int, int, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS questions (
+    set_id INTEGER NOT NULL REFERENCES sets(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    streak INTEGER NOT NULL DEFAULT 0,
+    score REAL NOT NULL DEFAULT 0.0,
+    PRIMARY KEY (set_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class VocabularyStore:
+    """A SQLite database holding the sets, their questions and the score of each question.
+
+    Questions are kept with their score in a single row, at their position in the set.
+    The store may be used from several threads, one at a time.
+    """
+    def __init__(self, path: Path = STORE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.RLock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.execute("PRAGMA foreign_keys = ON")
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Closes the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def is_empty(self) -> bool:
+        """Returns True if the store has no set."""
+        with self.__lock:
+            return self.__connection.execute("SELECT 1 FROM sets LIMIT 1").fetchone() is None
+
+    def get_meta(self, key: str) -> str | None:
+        """Returns the value stored under key, or None if there is none."""
+        with self.__lock:
+            found = self.__connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if found is None else found[0]
+
+    def set_meta(self, key: str, value: str):
+        """Stores value under key, replacing the previous one."""
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def load_all(self) -> list[tuple[int, str, list[Row]]]:
+        """Returns the id, name and rows of every set, with a single query."""
+        with self.__lock:
+            cursor = self.__connection.execute(
+                "SELECT sets.id, sets.name, question, answer, total, correct, streak, score "
+                "FROM sets LEFT JOIN questions ON questions.set_id = sets.id "
+                "ORDER BY sets.id, position"
+            )
+            records = cursor.fetchall()
+
+        sets: list[tuple[int, str, list[Row]]] = []
+        for (set_id, name), group in itertools.groupby(records, key=lambda record: (record[0], record[1])):
+            # Sets without questions come with a single row of NULLs
+            rows = [record[2:] for record in group if record[2] is not None]
+            sets.append((set_id, name, rows))
+        return sets
+
+    def load_set(self, set_id: int) -> tuple[str, list[Row]] | None:
+        """Returns the name and rows of a set, or None if there is no such set."""
+        with self.__lock:
+            found = self.__connection.execute("SELECT name FROM sets WHERE id = ?", (set_id,)).fetchone()
+            if found is None:
+                return None
+            rows = self.__connection.execute(
+                "SELECT question, answer, total, correct, streak, score FROM questions "
+                "WHERE set_id = ? ORDER BY position",
+                (set_id,)
+            ).fetchall()
+        return found[0], rows
+
+    def save_set(self, set_id: int | None, name: str, rows: Iterable[Row]) -> int:
+        """Replaces the name and rows of a set in a single transaction, creating it if needed. Returns its id."""
+        with self.__lock, self.__connection:
+            cursor = self.__connection.execute(
+                "INSERT INTO sets (id, name) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET name = excluded.name",
+                (set_id, name)
+            )
+            if set_id is None:
+                set_id = cursor.lastrowid
+                assert set_id is not None
+            self.__connection.execute("DELETE FROM questions WHERE set_id = ?", (set_id,))
+            self.__connection.executemany(
+                "INSERT INTO questions (set_id, position, question, answer, total, correct, streak, score) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((set_id, position, *row) for position, row in enumerate(rows))
+            )
+        return set_id
+
+    def update_score(self, set_id: int, position: int, total: int, correct: int, streak: int, score: float) -> bool:
+        """Updates the score of a single question. Returns False if the question does not exist."""
+        with self.__lock, self.__connection:
+            cursor = self.__connection.execute(
+                "UPDATE questions SET total = ?, correct = ?, streak = ?, score = ? WHERE set_id = ? AND position = ?",
+                (total, correct, streak, score, set_id, position)
+            )
+        return cursor.rowcount == 1
+
+    def delete_set(self, set_id: int):
+        """Deletes a set with its questions."""
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM sets WHERE id = ?", (set_id,))
@@ -0,0 +1,44 @@
+"""Prefix tree of strings, to tell in the length of a prefix how many strings start with it."""
+
+
+class PrefixTrie:
+    """Strings counted by prefix, in a tree with a node per character.
+
+    Each node holds the number of strings starting with the characters leading to it,
+    so a prefix is looked up in O(len(prefix)), regardless of the number of strings.
+    """
+    def __init__(self):
+        # Node: [number of strings through it, children by character]
+        self.__root: list = [0, {}]
+
+    def __len__(self) -> int:
+        return self.__root[0]
+
+    def add(self, string: str, count: int = 1):
+        """Adds count occurrences of string, or removes them if count is negative."""
+        node = self.__root
+        node[0] += count
+        for c in string:
+            children = node[1]
+            child = children.get(c)
+            if child is None:
+                child = children[c] = [0, {}]
+            child[0] += count
+            if child[0] <= 0:
+                # No string goes through its descendants either
+                del children[c]
+                return
+            node = child
+
+    def remove(self, string: str):
+        """Removes an occurrence of string."""
+        self.add(string, -1)
+
+    def count(self, prefix: str) -> int:
+        """Returns the number of strings starting with prefix."""
+        node = self.__root
+        for c in prefix:
+            node = node[1].get(c)
+            if node is None:
+                return 0
+        return node[0]
@@ -1,10 +1,20 @@
 from pathlib import Path
 
+from concurrent.futures import ThreadPoolExecutor
+from math import fsum
+import re
 import tempfile
+import threading
+import zlib
 
-from lib.score import Score, ScoreFile
+from lib.history import AnswerEvent, HistoryFile, question_id
+from lib.manifest import FileStat, Manifest, SetSummary, file_stat, scan_folder
+from lib.normalization import normalize, options as normalization_options
+from lib.score import Score, ScoreFile, ScoreTable
+from lib.store import Row, VocabularyStore
 
 from enum import Enum
+from typing import Iterable, Iterator, NamedTuple, Sequence, overload
 
 VOC_FOLDER = Path.cwd() / "data" / "vocabulary"
 VOC_SCORES_FOLDER = Path.cwd() / "scores" / "vocabulary"
@@ -12,6 +22,21 @@ VOC_SCORES_FOLDER = Path.cwd() / "scores" / "vocabulary"
 VOC_FOLDER.mkdir(parents=True, exist_ok=True)
 VOC_SCORES_FOLDER.mkdir(parents=True, exist_ok=True)
 
+# Summaries of the sets kept in files
+MANIFEST_PATH = VOC_SCORES_FOLDER / "manifest.json"
+# Search index of the questions of all sets
+SEARCH_INDEX_PATH = VOC_SCORES_FOLDER / "search_index.json"
+
+# Where the sets are kept: "files" for a vocabulary and a score file per set, "sqlite" for a single database
+STORAGE = "files"
+
+_store: VocabularyStore | None = None
+# Key of the store metadata telling that the sets of the files were imported
+_FILES_IMPORTED_KEY = "files_imported"
+
+# Maximum number of sets loaded at once by `load_sets`
+LOAD_WORKERS = 8
+
 
 
 class Gender(Enum):
@@ -34,8 +59,44 @@ class Gender(Enum):
 class _QuestionData:
     """Internal data structure for vocabulary question storage."""
     def __init__(self, question: str, answer: str):
-        self.question = question
-        self.answer = answer
+        self._question = question
+        self._answer = answer
+        # Vocabulary file this data belongs to, notified of changes
+        self._file: "_VocabularyFile | None" = None
+        # Normalization options, and the normalized question and answer computed with them
+        self.__keys: tuple[tuple[bool, bool], str, str] | None = None
+
+    @property
+    def question(self) -> str:
+        return self._question
+
+    @question.setter
+    def question(self, question: str):
+        self._question = question
+        self._changed()
+
+    @property
+    def answer(self) -> str:
+        return self._answer
+
+    @answer.setter
+    def answer(self, answer: str):
+        self._answer = answer
+        self._changed()
+
+    def keys(self) -> tuple[str, str]:
+        """Returns the normalized question and answer, computed once until they are edited."""
+        keys = self.__keys
+        current_options = normalization_options()
+        if keys is None or keys[0] != current_options:
+            keys = (current_options, normalize(self._question), normalize(self._answer))
+            self.__keys = keys
+        return keys[1], keys[2]
+
+    def _changed(self):
+        self.__keys = None
+        if self._file is not None:
+            self._file.generation += 1
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, _QuestionData):
@@ -54,8 +115,27 @@ class _VocabularyFile:
     def __init__(self, name: str, questions: list[_QuestionData] | None = None):
         self.__name = name
         self.__filepath = self._filepath_for_name(name)
-        self.questions: list[_QuestionData] = questions if questions is not None else []
+        self.questions: list[_QuestionData] = []
+
+        # Incremented by every change of the questions or name, and value of it when last loaded or saved
+        self.generation = 0
+        self.__saved_generation: int | None = None
 
+        for data in questions or []:
+            self.add_question(data)
+
+    def add_question(self, data: _QuestionData):
+        """Adds a question at the end of the file."""
+        data._file = self
+        self.questions.append(data)
+        self.generation += 1
+
+    def clear_questions(self):
+        """Removes all questions."""
+        for data in self.questions:
+            data._file = None
+        self.questions.clear()
+        self.generation += 1
 
     @classmethod
     def load(cls, name: str) -> "_VocabularyFile":
@@ -90,12 +170,17 @@ class _VocabularyFile:
             answer = parts[1].strip()
 
             data = _QuestionData(question, answer)
-            vocab_file.questions.append(data)
+            vocab_file.add_question(data)
 
+        vocab_file.__saved_generation = vocab_file.generation
         return vocab_file
     
     def save(self):
-        """Saves the vocabulary file to its filepath."""
+        """Saves the vocabulary file to its filepath.
+        
+        The questions are copied first, so they may be changed by another thread during the save."""
+        generation = self.generation
+        lines = [f"{q.question}\t{q.answer}\n" for q in list(self.questions)]
 
         # Renames if needed
         new_filepath = self._filepath_for_name(self.__name)
@@ -110,18 +195,22 @@ class _VocabularyFile:
 
         with tempfile.NamedTemporaryFile("w", dir=self.__filepath.parent, encoding="utf-8", delete=False) as f:
             f.write("0\n")  # version
-            for q in self.questions:
-                line = f"{q.question}\t{q.answer}\n"
-                f.write(line)
+            f.writelines(lines)
             
             f.flush()
             temp_name = f.name
         # Move temp file to final location
         temp_path = Path(temp_name)
         temp_path.replace(self.__filepath)
+        self.__saved_generation = generation
 
-    def check_saved(self) -> bool:
-        """Checks if the current in-memory questions match the saved file."""
+    def check_saved(self, verify: bool = False) -> bool:
+        """Checks if the current in-memory questions match the saved file.
+        
+        Only checks that the questions did not change since they were loaded or saved,
+        unless verify is True, in which case the file is loaded and compared."""
+        if not verify:
+            return self.generation == self.__saved_generation
         if not self.__filepath.exists():
             return False
         try:
@@ -157,6 +246,8 @@ class _VocabularyFile:
     @name.setter
     def name(self, new_name: str):
         """Renames the vocabulary file."""
+        if new_name != self.__name:
+            self.generation += 1
         self.__name = new_name
 
 
@@ -171,7 +262,7 @@ class Question:
 
     def add_to_files(self, voc_file: _VocabularyFile, score_file: ScoreFile):
         """Adds this question to the given vocabulary and score files."""
-        voc_file.questions.append(self._data)
+        voc_file.add_question(self._data)
         score_file.scores.append(self._score)
 
     @property
@@ -184,6 +275,16 @@ class Question:
         """Returns the answer string."""
         return self._data.answer
 
+    @property
+    def question_key(self) -> str:
+        """Returns the normalized question string, to compare it to others."""
+        return self._data.keys()[0]
+
+    @property
+    def answer_key(self) -> str:
+        """Returns the normalized answer string, to compare it to given answers."""
+        return self._data.keys()[1]
+
     @property
     def score(self) -> float:
         """Returns the question score."""
@@ -194,6 +295,16 @@ class Question:
         """Returns the average score (correct/total) for this question."""
         return self._score.average
 
+    @property
+    def streak(self) -> int:
+        """Returns the number of correct answers in a row."""
+        return self._score.streak
+
+    @property
+    def id(self) -> int:
+        """Returns the id of the question in answer histories."""
+        return question_id(self._data.question, self._data.answer)
+
     def score_str(self) -> str:
         """Returns a string representation of the question score."""
         if self._score.total == 0:
@@ -209,35 +320,140 @@ class Question:
         """Resets the question and answer strings, as well as score in place."""
         self._data.question = question
         self._data.answer = answer
-        self._score = Score()
+        self._score.reset()
+
+class QuestionsView(Sequence[Question]):
+    """Read-only view of the questions of a set, in order."""
+    def __init__(self, questions: list[Question]):
+        self.__questions = questions
+
+    def __len__(self) -> int:
+        return len(self.__questions)
+
+    @overload
+    def __getitem__(self, index: int) -> Question: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Question]: ...
+    def __getitem__(self, index: int | slice) -> Question | list[Question]:
+        return self.__questions[index]
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self.__questions)
 
 class QuestionSet:
 
     new_set_name = "Enter a name"
 
     """Represents a set of vocabulary questions with their scores."""
-    def __init__(self, name: str | None = None):
+    def __init__(self, name: str | None = None, lazy: bool = False):
+        """Creates the set of the given name. If lazy, its files are only loaded when first needed."""
         # Preserve empty-string names. Only use the placeholder when name is None.
         self._name = name if name is not None else self.new_set_name
         
-        self._vocab_file = _VocabularyFile.load(self._name)
-        self._score_file = ScoreFile.load(VOC_SCORES_FOLDER, self._name)
+        # Held while reading or writing the files, which may happen on a background thread
+        self._lock = threading.RLock()
+
+        self.__vocab_file: _VocabularyFile | None = None
+        self.__score_file: ScoreFile | None = None
+        # Questions of the set, built once from the files and kept along with their changes
+        self.__questions: list[Question] | None = None
+        self._history = HistoryFile(VOC_SCORES_FOLDER, self._name)
+        # Summary from the manifest, used while the set is not loaded
+        self._summary: SetSummary | None = None
+
+        if not lazy:
+            self._load()
+
+    def _load(self):
+        """Loads the questions and scores from the files, if not done yet."""
+        if self.__vocab_file is not None:
+            return
+        with self._lock:
+            if self.__vocab_file is not None:
+                return
+
+            vocab_file = _VocabularyFile.load(self._name)
+            score_file = ScoreFile.load(VOC_SCORES_FOLDER, self._name)
+
+            # Ensure scores list matches questions list, new scores are written by the next save or compaction
+            score_file.pad(len(vocab_file.questions))
+
+            self.__score_file = score_file
+            self.__vocab_file = vocab_file
 
-        # Ensure scores list matches questions list
-        while len(self._score_file.scores) < len(self._vocab_file.questions):
-            self._score_file.scores.append(Score())
+    @property
+    def is_loaded(self) -> bool:
+        """Returns True if the questions and scores of the set are in memory."""
+        return self.__vocab_file is not None
+
+    @property
+    def _vocab_file(self) -> _VocabularyFile:
+        self._load()
+        assert self.__vocab_file is not None
+        return self.__vocab_file
+
+    @_vocab_file.setter
+    def _vocab_file(self, vocab_file: _VocabularyFile):
+        self.__vocab_file = vocab_file
+        self.__questions = None
+
+    @property
+    def _score_file(self) -> ScoreFile:
+        self._load()
+        assert self.__score_file is not None
+        return self.__score_file
+
+    @_score_file.setter
+    def _score_file(self, score_file: ScoreFile):
+        self.__score_file = score_file
+        self.__questions = None
         
-        # Save scores if needed
-        if not self._score_file.check_saved():
-            self._score_file.save()
+    def summary(self) -> SetSummary:
+        """Returns the number of questions and the mean average score of the set.
         
+        Comes from the manifest if the set was not loaded."""
+        if not self.is_loaded and self._summary is not None:
+            return self._summary
+        scores = self._score_file.scores
+        count = min(len(scores), len(self._vocab_file.questions))
+        mastery = fsum(scores.score[:count]) / count if count else 0.0
+        return SetSummary(count, mastery)
+
+    def content_stamp(self) -> tuple[int, ...] | None:
+        """Returns a value that changes whenever the saved questions of the set do, None if it was never saved."""
+        return file_stat(_VocabularyFile._filepath_for_name(self._name))
+
+    def question_pairs(self) -> list[tuple[str, str]]:
+        """Returns the saved question and answer of each question, without loading the scores."""
+        with self._lock:
+            if self.is_loaded and self._vocab_file.check_saved():
+                return [(data.question, data.answer) for data in self._vocab_file.questions]
+        return [(data.question, data.answer) for data in _VocabularyFile.load(self._name).questions]
+
+    def _file_stats(self) -> list[FileStat]:
+        """Returns the stats of the vocabulary, score and journal files of the set."""
+        return [
+            file_stat(_VocabularyFile._filepath_for_name(self._name)),
+            file_stat(self._score_file._filepath_for_name(self._name)),
+            file_stat(self._score_file._journal_path_for_name(self._name)),
+        ]
+
     @property
-    def questions(self) -> list[Question]:
-        """Returns the list of vocabulary questions with their scores."""
-        vocab_questions: list[Question] = []
-        for data, score in zip(self._vocab_file.questions, self._score_file.scores):
-            vocab_questions.append(Question(data, score))
-        return vocab_questions
+    def questions(self) -> QuestionsView:
+        """Returns the vocabulary questions with their scores.
+        
+        The same questions are returned until the set is cleared or restored."""
+        return QuestionsView(self._question_list())
+
+    def _question_list(self) -> list[Question]:
+        """Returns the cached questions, built from the files if they are missing or out of date."""
+        questions = self.__questions
+        vocab_file, score_file = self._vocab_file, self._score_file
+        if questions is None or len(questions) != min(len(vocab_file.questions), len(score_file.scores)):
+            with self._lock:
+                questions = [Question(data, score) for data, score in zip(vocab_file.questions, score_file.scores)]
+                self.__questions = questions
+        return questions
     
     @property
     def name(self) -> str:
@@ -249,11 +465,15 @@ class QuestionSet:
         """Sets a new name for the vocabulary set, renaming the underlying files."""
         self._vocab_file.name = new_name
         self._score_file.name = new_name
+        self._history.name = new_name
         self._name = new_name
 
     def add_question(self, question: Question):
         """Adds a new vocabulary question to the set."""
-        question.add_to_files(self._vocab_file, self._score_file)
+        with self._lock:
+            questions = self._question_list()
+            question.add_to_files(self._vocab_file, self._score_file)
+            questions.append(question)
 
     def save(self):
         """Saves the vocabulary set to its files.
@@ -261,50 +481,327 @@ class QuestionSet:
         Raises exception if name is new_set_name.
         """
 
+        self.check_name()
+
+        with self._lock:
+            self._vocab_file.save()
+            self._score_file.save()
+            self._history.rename()
+
+    def check_name(self):
+        """Raises exception if the set can not be saved under its name."""
         if self._name == self.new_set_name:
             raise ValueError(f"Name '{self.new_set_name}' is reserved.")
-
-        self._vocab_file.save()
-        self._score_file.save()
         
+    def record_answer(self, question: Question, save: bool = True) -> bool:
+        """Persists the score of a question of the set after it was answered.
+        
+        Only appends to the score journal when possible, otherwise saves the set if save is True.
+        Returns False if the set still has to be saved."""
+        with self._lock:
+            if self._score_file.record(question._score):
+                return True
+        if save:
+            self.save()
+            return True
+        return False
+
+    def record_history(self, question: Question, correct: bool):
+        """Appends an answer to a question of the set to the answer history."""
+        with self._lock:
+            self._history.append(question.id, correct)
+
+    def history(self) -> Iterator[AnswerEvent]:
+        """Iterates over the answers of the set, from the oldest, without loading the whole history."""
+        return self._history.events()
+
+    def compact_journal(self):
+        """Merges the score journal into the score file. Nothing to do if the set was not loaded."""
+        with self._lock:
+            if self.is_loaded:
+                self._score_file.compact()
+
     def restore(self):
-        self.__dict__.update(QuestionSet(self._name).__dict__)
+        """Discards the changes in memory. The files are loaded again when next needed."""
+        with self._lock:
+            state = QuestionSet(self._name, lazy=True).__dict__
+            del state["_lock"]
+            self.__dict__.update(state)
 
     def delete(self):
         """Deletes the vocabulary set files."""
-        self._vocab_file.delete()
-        self._score_file.delete()
+        with self._lock:
+            if self.is_loaded:
+                self._vocab_file.delete()
+                self._score_file.delete()
+            else:
+                _VocabularyFile(self._name).delete()
+                ScoreFile(VOC_SCORES_FOLDER, self._name).delete()
+            self._history.delete()
 
     def clear_all_questions(self):
         """Clears all questions from the set."""
-        self._vocab_file.questions.clear()
-        self._score_file.scores.clear()
+        with self._lock:
+            self._vocab_file.clear_questions()
+            self._score_file.clear()
+            self.__questions = []
+
+    @classmethod
+    def new(cls, storage: str | None = None) -> "QuestionSet":
+        """Creates an empty set, kept in the given storage or the one in use."""
+        if (storage or STORAGE) == "sqlite":
+            return StoredQuestionSet()
+        return QuestionSet()
 
     @classmethod
-    def load_all(cls):
-        """Loads all vocabulary sets from the vocabulary folder."""
+    def load_all(cls) -> "list[QuestionSet]":
+        """Loads all vocabulary sets from the storage in use, in natural order of their names."""
+        if STORAGE == "sqlite":
+            vocab_sets: list[QuestionSet] = list(StoredQuestionSet.load_all())
+        else:
+            vocab_sets = cls._load_all_files()
+        vocab_sets.sort(key=lambda qset: natural_key(qset.name))
+        return vocab_sets
+
+    @classmethod
+    def _load_all_files(cls) -> "list[QuestionSet]":
+        """Lists all vocabulary sets of the vocabulary folder, which are loaded when first needed.
+        
+        Their summaries come from the manifest: only the sets whose files changed since are loaded to summarize them."""
+        manifest = Manifest.load(MANIFEST_PATH)
+        vocab_stats = scan_folder(VOC_FOLDER, ".voc")
+        score_stats = scan_folder(VOC_SCORES_FOLDER, ".voc_score")
+        journal_stats = scan_folder(VOC_SCORES_FOLDER, ".voc_score_journal")
+
         vocab_sets: list[QuestionSet] = []
-        for filepath in VOC_FOLDER.glob("*.voc"):
-            try:
-                # Derive the set name by stripping the literal suffix '.voc'
-                # from the filename. This ensures a file named '.voc'
-                # produces an empty string name (instead of '.voc').
-                filename = filepath.name
-                if filename.endswith(".voc"):
-                    name = filename[:-4]
-                else:
-                    raise ValueError(f"Invalid vocabulary file name: {filename}")
-
-                vocab_set = cls(name)
+        # Changed sets with the stats of their files, which loading does not write
+        changed_sets: dict[QuestionSet, list[FileStat]] = {}
+        for name, vocab_stat in vocab_stats.items():
+            vocab_set = cls(name, lazy=True)
+            stats: list[FileStat] = [vocab_stat, score_stats.get(name), journal_stats.get(name)]
+            vocab_set._summary = manifest.get(name, stats)
+            if vocab_set._summary is None:
+                changed_sets[vocab_set] = stats
+            else:
                 vocab_sets.append(vocab_set)
-            except Exception as e:
-                print(f"Error loading vocabulary set from {filepath}: {e}")
-                continue
+
+        loaded = load_sets(changed_sets)
+        for vocab_set, e in loaded.errors:
+            print(f"Error loading vocabulary set {vocab_set.name}: {e}")
+        for vocab_set in loaded.sets:
+            vocab_set._summary = vocab_set.summary()
+            manifest.set(vocab_set.name, changed_sets[vocab_set], vocab_set._summary)
+            vocab_sets.append(vocab_set)
+
+        manifest.prune(vocab_stats)
+        try:
+            manifest.save()
+        except OSError as e:
+            print(f"Error saving the vocabulary manifest: {e}")
         return vocab_sets
+
+    @staticmethod
+    def update_manifest(sets: "Iterable[QuestionSet]"):
+        """Updates the manifest with the summaries of the loaded sets kept in files, as saved."""
+        manifest = Manifest.load(MANIFEST_PATH)
+        for qset in sets:
+            if isinstance(qset, StoredQuestionSet) or not qset.is_loaded or not qset.check_saved():
+                continue
+            manifest.set(qset.name, qset._file_stats(), qset.summary())
+        manifest.save()
     
-    def check_saved(self) -> bool:
-        """Checks if the current in-memory set matches the saved file."""
+    def check_saved(self, verify: bool = False) -> bool:
+        """Checks if the current in-memory set matches the saved files.
+        
+        If verify is True, the files are loaded and compared instead of relying on change tracking."""
         if self._name == self.new_set_name:
             return False
-        return self._vocab_file.check_saved() and self._score_file.check_saved()
+        if not verify and not self.is_loaded:
+            return True
+        with self._lock:
+            return self._vocab_file.check_saved(verify) and self._score_file.check_saved(verify)
+    
+
+
+def natural_key(s: str) -> list[int | str]:
+    """Returns a key sorting strings case insensitively, with their numbers in numeric order."""
+    return [
+        int(part) if part.isdigit() else part.lower()
+        for part in re.split(r'(\d+)', s)
+    ]
+
+class LoadResult(NamedTuple):
+    """Sets that were loaded, and the sets that could not be loaded with their error."""
+    sets: list[QuestionSet]
+    errors: list[tuple[QuestionSet, BaseException]]
+
+def load_sets(sets: Iterable[QuestionSet], workers: int = LOAD_WORKERS) -> LoadResult:
+    """Loads the questions and scores of sets concurrently, on at most `workers` threads.
     
+    The sets are returned in natural order of their names. Errors are collected instead of raised."""
+    sets = sorted(sets, key=lambda qset: natural_key(qset.name))
+    to_load = [qset for qset in sets if not qset.is_loaded]
+    failed: dict[QuestionSet, BaseException] = {}
+    if to_load:
+        with ThreadPoolExecutor(max_workers=min(workers, len(to_load)), thread_name_prefix="SetLoader") as executor:
+            futures = [(qset, executor.submit(qset._load)) for qset in to_load]
+        for qset, future in futures:
+            error = future.exception()
+            if error is not None:
+                failed[qset] = error
+    return LoadResult(
+        [qset for qset in sets if qset not in failed],
+        [(qset, failed[qset]) for qset in sets if qset in failed]
+    )
+
+def load_library(workers: int = LOAD_WORKERS) -> LoadResult:
+    """Loads the questions and scores of all vocabulary sets of the storage in use."""
+    return load_sets(QuestionSet.load_all(), workers)
+
+def get_store() -> VocabularyStore:
+    """Returns the store of the vocabulary sets. When first created, the sets of the files are imported into it.
+    
+    The import is recorded in the store, so that sets deleted from it are not imported again."""
+    global _store
+    if _store is None:
+        _store = VocabularyStore()
+        if _store.get_meta(_FILES_IMPORTED_KEY) is None:
+            import_files(_store)
+            _store.set_meta(_FILES_IMPORTED_KEY, "1")
+    return _store
+
+def import_files(store: VocabularyStore) -> int:
+    """Copies the sets of the vocabulary and score folders into store, skipping the names it already has.
+    
+    Returns the number of imported sets."""
+    names = {name for _, name, _ in store.load_all()}
+    imported = 0
+    loaded = load_sets(qset for qset in QuestionSet._load_all_files() if qset.name not in names)
+    for qset, e in loaded.errors:
+        print(f"Error importing vocabulary set {qset.name}: {e}")
+    for qset in loaded.sets:
+        rows = [(q.question, q.answer, *q._score.values()) for q in qset.questions]
+        store.save_set(None, qset.name, rows)
+        names.add(qset.name)
+        imported += 1
+    return imported
+
+
+class StoredQuestionSet(QuestionSet):
+    """A set of vocabulary questions kept in the SQLite store, instead of its own files."""
+    def __init__(self, name: str | None = None, set_id: int | None = None, rows: Iterable[Row] = ()):
+        self._name = name if name is not None else self.new_set_name
+        self._lock = threading.RLock()
+        self._set_id = set_id
+        self._summary = None
+
+        rows = list(rows)
+        self._vocab_file = _VocabularyFile(self._name, [_QuestionData(row[0], row[1]) for row in rows])
+        scores = ScoreTable()
+        for row in rows:
+            scores.append_row(*row[2:])
+        # Only holds the scores, its files are not used
+        self._score_file = ScoreFile(VOC_SCORES_FOLDER, self._name, scores)
+        self._history = HistoryFile(VOC_SCORES_FOLDER, self._name)
+
+        # Generation of the questions, table and generation of the scores, and number of scores in the store
+        self._saved: tuple[int, ScoreTable, int, int] | None = None
+        if set_id is not None:
+            self._saved = (self._vocab_file.generation, scores, scores.generation, len(scores))
+
+    def content_stamp(self) -> tuple[int, ...] | None:
+        """Returns a value that changes whenever the questions of the set do, None if it was never saved."""
+        if self._set_id is None:
+            return None
+        lines = "".join(f"{question}\t{answer}\n" for question, answer in self.question_pairs())
+        return self._set_id, zlib.crc32(lines.encode("utf-8"))
+
+    def question_pairs(self) -> list[tuple[str, str]]:
+        """Returns the question and answer of each question."""
+        with self._lock:
+            return [(data.question, data.answer) for data in self._vocab_file.questions]
+
+    def _rows(self) -> list[Row]:
+        table = self._score_file.scores
+        return [(data.question, data.answer, *table.row(i)) for i, data in enumerate(list(self._vocab_file.questions)[:len(table)])]
+
+    def save(self):
+        """Saves the vocabulary set to the store.
+        
+        Raises exception if name is new_set_name.
+        """
+        self.check_name()
+
+        with self._lock:
+            vocab_generation = self._vocab_file.generation
+            table = self._score_file.scores
+            generation = table.generation
+            rows = self._rows()
+            self._set_id = get_store().save_set(self._set_id, self._name, rows)
+            self._saved = (vocab_generation, table, generation, len(rows))
+            self._history.rename()
+
+    def record_answer(self, question: Question, save: bool = True) -> bool:
+        """Persists the score of a question of the set after it was answered.
+        
+        Only updates the row of the question when possible, otherwise saves the set if save is True.
+        Returns False if the set still has to be saved."""
+        with self._lock:
+            saved = self._saved
+            table = self._score_file.scores
+            score = question._score
+            if (self._set_id is not None and saved is not None and
+                    saved[1] is table and saved[3] == len(table) and score._table is table):
+                generation = table.generation
+                if get_store().update_score(self._set_id, score._index, *score.values()):
+                    # Still saved if the recorded update is the only change since the last save
+                    if generation == saved[2] + 1:
+                        self._saved = (saved[0], table, generation, saved[3])
+                    return True
+        if save:
+            self.save()
+            return True
+        return False
+
+    def compact_journal(self):
+        """Answers are stored in place, there is no journal to merge."""
+
+    def restore(self):
+        with self._lock:
+            loaded = get_store().load_set(self._set_id) if self._set_id is not None else None
+            if loaded is None:
+                state = StoredQuestionSet(self._name).__dict__
+            else:
+                state = StoredQuestionSet(loaded[0], self._set_id, loaded[1]).__dict__
+            del state["_lock"]
+            self.__dict__.update(state)
+
+    def delete(self):
+        """Deletes the vocabulary set from the store."""
+        with self._lock:
+            if self._set_id is not None:
+                get_store().delete_set(self._set_id)
+            self._history.delete()
+            self._set_id = None
+            self._saved = None
+
+    @classmethod
+    def load_all(cls) -> "list[StoredQuestionSet]":
+        """Loads all vocabulary sets from the store, with a single query."""
+        return [cls(name, set_id, rows) for set_id, name, rows in get_store().load_all()]
+
+    def check_saved(self, verify: bool = False) -> bool:
+        """Checks if the current in-memory set matches the store.
+        
+        If verify is True, the set is loaded from the store and compared instead of relying on change tracking."""
+        if self._name == self.new_set_name:
+            return False
+        with self._lock:
+            if not verify:
+                saved = self._saved
+                table = self._score_file.scores
+                return (saved is not None and saved[1] is table and
+                        (saved[0], saved[2]) == (self._vocab_file.generation, table.generation))
+
+            loaded = get_store().load_set(self._set_id) if self._set_id is not None else None
+            return loaded is not None and loaded == (self._name, self._rows())
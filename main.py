@@ -174,4 +174,11 @@ ttk.Label(grammar_frame, text="Grammar Exercises (Coming Soon!)").grid(column=0,
 # Start with menu visible
 menu_pager.show_page(menu_page)
 
+def on_close():
+	vocabulary_gui.SAVE_QUEUE.close()
+	vocab_page.compact_score_journals()
+	main.destroy()
+
+main.protocol("WM_DELETE_WINDOW", on_close)
+
 main.mainloop()
\ No newline at end of file
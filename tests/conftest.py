@@ -0,0 +1,31 @@
+import pytest
+
+import lib.vocabulary as vocabulary
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Keeps the vocabulary and score files, the manifest and the store in a temporary folder."""
+    voc_folder = tmp_path / "data" / "vocabulary"
+    scores_folder = tmp_path / "scores" / "vocabulary"
+    voc_folder.mkdir(parents=True)
+    scores_folder.mkdir(parents=True)
+    monkeypatch.setattr(vocabulary, "VOC_FOLDER", voc_folder)
+    monkeypatch.setattr(vocabulary, "VOC_SCORES_FOLDER", scores_folder)
+    monkeypatch.setattr(vocabulary, "MANIFEST_PATH", scores_folder / "manifest.json")
+    monkeypatch.setattr(vocabulary, "SEARCH_INDEX_PATH", scores_folder / "search_index.json")
+    monkeypatch.setattr(vocabulary, "_store", None)
+    yield tmp_path
+    if vocabulary._store is not None:
+        vocabulary._store.close()
+
+
+def make_set(name: str, pairs: list[tuple[str, str]]) -> vocabulary.QuestionSet:
+    """Creates and saves a set of the given questions and answers in the files of the library."""
+    qset = vocabulary.QuestionSet(name)
+    for question, answer in pairs:
+        q = vocabulary.Question()
+        q.reset_with(question, answer)
+        qset.add_question(q)
+    qset.save()
+    return qset
@@ -0,0 +1,48 @@
+import itertools
+import random
+
+from lib.fuzzy import BKTree, distance
+
+
+def naive_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def random_strings(rng: random.Random, count: int, alphabet: str = "abcä") -> list[str]:
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9))) for _ in range(count)]
+
+
+def test_distance_matches_naive():
+    rng = random.Random(1)
+    strings = random_strings(rng, 60) + ["straße", "strasse", "", "x" * 70, "y" + "x" * 69]
+    for a, b in itertools.product(strings, repeat=2):
+        assert distance(a, b) == naive_distance(a, b), (a, b)
+
+
+def test_distance_with_limit():
+    rng = random.Random(2)
+    strings = random_strings(rng, 50)
+    for a, b in itertools.product(strings, repeat=2):
+        expected = naive_distance(a, b)
+        for limit in range(4):
+            assert distance(a, b, limit) == min(expected, limit + 1), (a, b, limit)
+
+
+def test_bk_tree_matches_linear_search():
+    rng = random.Random(3)
+    words = random_strings(rng, 200)
+    tree = BKTree()
+    for word in words:
+        tree.add(word)
+    assert len(tree) == len(set(words))
+
+    for query in random_strings(rng, 30):
+        for max_distance in range(3):
+            expected = sorted({(d, word) for word in words if (d := naive_distance(query, word)) <= max_distance})
+            assert tree.search(query, max_distance) == expected, (query, max_distance)
@@ -0,0 +1,46 @@
+import pytest
+
+from lib.history import AnswerEvent, HistoryFile
+
+
+def test_append_and_read(tmp_path):
+    history = HistoryFile(tmp_path, "set")
+    events = [AnswerEvent(1, 100.0, True), AnswerEvent(2, 101.5, False), AnswerEvent(1, 102.0, True)]
+    for event in events:
+        history.append(event.question_id, event.correct, event.timestamp)
+
+    assert list(HistoryFile(tmp_path, "set").events()) == events
+
+
+def test_read_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("lib.history.READ_CHUNK_EVENTS", 2)
+    history = HistoryFile(tmp_path, "set")
+    for i in range(5):
+        history.append(i, i % 2 == 0, float(i))
+    assert [event.question_id for event in history.events()] == list(range(5))
+
+
+def test_torn_tail(tmp_path):
+    history = HistoryFile(tmp_path, "set")
+    history.append(1, True, 100.0)
+    history.append(2, False, 101.0)
+    with open(history.filepath, "ab") as f:
+        f.write(b"\x07\x00\x00")
+
+    # The torn event is ignored, and dropped by the next append
+    reopened = HistoryFile(tmp_path, "set")
+    assert [event.question_id for event in reopened.events()] == [1, 2]
+    reopened.append(3, True, 102.0)
+    assert list(reopened.events()) == [
+        AnswerEvent(1, 100.0, True), AnswerEvent(2, 101.0, False), AnswerEvent(3, 102.0, True),
+    ]
+
+
+def test_torn_header(tmp_path):
+    history = HistoryFile(tmp_path, "set")
+    history.filepath.write_bytes(b"VO")
+    with pytest.raises(ValueError):
+        list(history.events())
+
+    history.append(4, False, 100.0)
+    assert list(history.events()) == [AnswerEvent(4, 100.0, False)]
@@ -0,0 +1,27 @@
+import lib.vocabulary as vocabulary
+
+from tests.conftest import make_set
+
+
+def test_sets_are_loaded_in_natural_order_with_errors_collected(library):
+    for name in ["10. tenth", "2. second", "1. first", "2. broken"]:
+        make_set(name, [("house", "Haus")])
+    (library / "scores" / "vocabulary" / "2. broken.voc_score").write_bytes(b"9\n")
+
+    sets = [vocabulary.QuestionSet(name, lazy=True) for name in ["10. tenth", "2. broken", "1. first", "2. second"]]
+    loaded = vocabulary.load_sets(sets, workers=2)
+
+    assert [qset.name for qset in loaded.sets] == ["1. first", "2. second", "10. tenth"]
+    assert all(qset.is_loaded for qset in loaded.sets)
+    assert [(qset.name, type(e)) for qset, e in loaded.errors] == [("2. broken", ValueError)]
+    assert not loaded.errors[0][0].is_loaded
+
+
+def test_library_is_loaded_in_natural_order(library):
+    for name in ["b", "A 10", "A 9"]:
+        make_set(name, [("house", "Haus")])
+
+    loaded = vocabulary.load_library()
+    assert [qset.name for qset in loaded.sets] == ["A 9", "A 10", "b"]
+    assert all(qset.is_loaded for qset in loaded.sets)
+    assert loaded.errors == []
@@ -0,0 +1,103 @@
+import json
+
+import lib.vocabulary as vocabulary
+
+from lib.manifest import Manifest, SetSummary
+
+from tests.conftest import make_set
+
+STATS = [(1000, 20), (1000, 30), None]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "manifest.json"
+    manifest = Manifest(path)
+    manifest.set("set", STATS, SetSummary(3, 0.25))
+    manifest.save()
+
+    assert Manifest.load(path).get("set", STATS) == SetSummary(3, 0.25)
+    assert Manifest.load(path).get("other", STATS) is None
+
+
+def test_changed_stats_invalidate_the_entry(tmp_path):
+    manifest = Manifest(tmp_path / "manifest.json")
+    manifest.set("set", STATS, SetSummary(3, 0.25))
+
+    assert manifest.get("set", [(1001, 20), (1000, 30), None]) is None  # modified
+    assert manifest.get("set", [(1000, 21), (1000, 30), None]) is None  # resized
+    assert manifest.get("set", [(1000, 20), (1000, 30), (1000, 4)]) is None  # journal appeared
+    assert manifest.get("set", STATS) == SetSummary(3, 0.25)
+
+
+def test_prune(tmp_path):
+    path = tmp_path / "manifest.json"
+    manifest = Manifest(path)
+    manifest.set("kept", STATS, SetSummary(1, 0.0))
+    manifest.set("removed", STATS, SetSummary(2, 0.0))
+    manifest.prune(["kept", "unknown"])
+    manifest.save()
+
+    loaded = Manifest.load(path)
+    assert loaded.get("kept", STATS) == SetSummary(1, 0.0)
+    assert loaded.get("removed", STATS) is None
+
+
+def test_unreadable_or_other_version_is_empty(tmp_path):
+    path = tmp_path / "manifest.json"
+    assert Manifest.load(path).get("set", STATS) is None
+
+    for content in ["{not json", json.dumps({"version": 0, "sets": {}}), json.dumps({"version": 1, "sets": {"set": 3}})]:
+        path.write_text(content, encoding="utf-8")
+        assert Manifest.load(path).get("set", STATS) is None
+
+
+def test_sets_are_listed_from_the_manifest(library):
+    make_set("a", [("house", "Haus"), ("car", "Wagen")])
+    make_set("b", [("mouse", "Maus")])
+
+    first = vocabulary.QuestionSet.load_all()
+    assert [(qset.name, qset.summary().count) for qset in first] == [("a", 2), ("b", 1)]
+    assert (library / "scores" / "vocabulary" / "manifest.json").exists()
+
+    # Unchanged sets are summarized without being loaded
+    second = vocabulary.QuestionSet.load_all()
+    assert not any(qset.is_loaded for qset in second)
+    assert [qset.summary() for qset in second] == [qset.summary() for qset in first]
+
+
+def test_changed_sets_are_loaded_again(library):
+    make_set("a", [("house", "Haus")])
+    make_set("b", [("mouse", "Maus")])
+    make_set("c", [("car", "Wagen")])
+    vocabulary.QuestionSet.load_all()
+
+    # A question added to a
+    with open(library / "data" / "vocabulary" / "a.voc", "a", encoding="utf-8") as f:
+        f.write("dog\tHund\n")
+    # An answer to b recorded in its journal
+    b = vocabulary.QuestionSet("b")
+    question = b.questions[0]
+    question.update_score(True)
+    assert b.record_answer(question, save=False)
+    # And c deleted
+    vocabulary.QuestionSet("c").delete()
+
+    sets = {qset.name: qset for qset in vocabulary.QuestionSet.load_all()}
+    assert set(sets) == {"a", "b"}
+    assert sets["a"].is_loaded and sets["a"].summary().count == 2
+    assert sets["b"].is_loaded and sets["b"].summary().mastery > 0
+
+    manifest = json.loads((library / "scores" / "vocabulary" / "manifest.json").read_text(encoding="utf-8"))
+    assert set(manifest["sets"]) == {"a", "b"}
+
+
+def test_update_manifest(library):
+    qset = make_set("a", [("house", "Haus")])
+    question = qset.questions[0]
+    question.update_score(True)
+    assert qset.record_answer(question, save=False)
+    vocabulary.QuestionSet.update_manifest([qset])
+
+    listed = vocabulary.QuestionSet.load_all()
+    assert not listed[0].is_loaded
+    assert listed[0].summary() == qset.summary()
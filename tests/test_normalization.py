@@ -0,0 +1,69 @@
+import unicodedata
+
+import pytest
+
+import lib.normalization as normalization
+
+from lib.normalization import normalize, normalize_prefix
+
+
+@pytest.fixture
+def fold(monkeypatch):
+    monkeypatch.setattr(normalization, "FOLD_SPELLING", True)
+
+
+@pytest.fixture
+def strip(monkeypatch):
+    monkeypatch.setattr(normalization, "STRIP_ARTICLES", True)
+
+
+def test_spelling_is_kept_by_default():
+    assert normalize("Straße") == "straße"
+    assert normalize("Häuser") != normalize("Haeuser")
+    assert normalize("der Wagen") == "der wagen"
+
+
+def test_case_and_composition():
+    decomposed = unicodedata.normalize("NFD", "Größe")
+    assert decomposed != "Größe"
+    assert normalize(decomposed) == normalize("GRÖßE") == "größe"
+
+
+def test_whitespace_is_collapsed():
+    assert normalize("  das \t Haus\n ") == "das haus"
+    assert normalize("   ") == ""
+
+
+def test_folding(fold):
+    assert normalize("Straße") == normalize("STRASSE") == "strasse"
+    assert normalize("Häuser") == normalize("Haeuser") == "haeuser"
+    assert normalize(unicodedata.normalize("NFD", "Größe")) == "groesse"
+
+
+def test_articles(strip):
+    assert normalize("der Wagen") == "wagen"
+    assert normalize("Die  Häuser") == "häuser"
+    assert normalize("la maison") == "maison"
+    assert normalize("l'avis") == normalize("l’avis") == normalize("l' avis") == "avis"
+    # A lone article is the answer itself
+    assert normalize("der") == "der"
+    assert normalize("l'") == "l'"
+    assert normalize("Dermatologe") == "dermatologe"
+
+
+def test_articles_are_kept_by_default():
+    assert normalize("l'avis") == "l'avis"
+
+
+def test_prefix(strip):
+    # While only an article is typed, the prefix of the answer is not known yet
+    for typed in ["d", "de", "der", "EIN", "l", "l'", "l’"]:
+        assert normalize_prefix(typed) == "", typed
+    assert normalize_prefix("der W") == "w"
+    assert normalize_prefix("dx") == "dx"
+    assert normalize_prefix("l'a") == "a"
+
+
+def test_prefix_without_stripping():
+    assert normalize_prefix("de") == "de"
+    assert normalize_prefix("Der W") == "der w"
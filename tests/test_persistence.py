@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from lib.persistence import SaveQueue
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture
+def queue():
+    queue = SaveQueue(delay=0.2)
+    yield queue
+    queue.close()
+
+
+def test_requests_are_coalesced(queue):
+    saved = []
+    queue.request("set", lambda: saved.append("first"))
+    queue.request("other", lambda: saved.append("other"))
+    queue.request("set", lambda: saved.append("second"))
+    assert queue.is_pending("set")
+
+    queue.flush()
+    # Only the last request of a target runs, in the order of the first requests
+    assert saved == ["second", "other"]
+    assert not queue.is_pending("set")
+
+
+def test_saves_run_after_delay():
+    queue = SaveQueue(delay=0.05)
+    done = threading.Event()
+    queue.request("set", done.set)
+    assert done.wait(TIMEOUT)
+    queue.close()
+
+
+def test_flush_waits_for_running_save(queue):
+    started, release = threading.Event(), threading.Event()
+    saved = []
+
+    def slow_save():
+        started.set()
+        release.wait(TIMEOUT)
+        saved.append("set")
+
+    queue.request("set", slow_save)
+    flusher = threading.Thread(target=queue.flush)
+    flusher.start()
+    assert started.wait(TIMEOUT)
+    # A running save is not pending anymore, but not done either
+    assert queue.is_pending("set")
+
+    flusher.join(0.1)
+    assert flusher.is_alive()
+    release.set()
+    flusher.join(TIMEOUT)
+    assert not flusher.is_alive()
+    assert saved == ["set"]
+    assert not queue.is_pending("set")
+
+
+def test_cancel(queue):
+    saved = []
+    queue.request("set", lambda: saved.append("set"))
+    assert queue.cancel("set")
+    assert not queue.cancel("set")
+    assert not queue.is_pending("set")
+    queue.flush()
+    assert saved == []
+
+
+def test_errors_are_reported(queue):
+    error = OSError("disk full")
+
+    def failing_save():
+        raise error
+
+    queue.request("set", failing_save)
+    queue.flush()
+    assert queue.pop_errors() == [("set", error)]
+    assert queue.pop_errors() == []
+
+
+def test_request_after_close_raises(queue):
+    saved = []
+    queue.request("set", lambda: saved.append("set"))
+    queue.close()
+    # Pending saves are run when closing
+    assert saved == ["set"]
+    with pytest.raises(RuntimeError):
+        queue.request("set", lambda: None)
@@ -0,0 +1,52 @@
+from lib.question_index import QuestionIndex
+from lib.vocabulary import Question
+
+
+def question(text: str, answer: str) -> Question:
+    q = Question()
+    q.reset_with(text, answer)
+    return q
+
+
+def test_lookups_by_normalized_strings():
+    house, home, car = question("house", "das Haus"), question("home", "das  HAUS"), question("car", "der Wagen")
+    index = QuestionIndex([house, home, car])
+
+    assert index.with_answer("das haus") == [house, home]
+    assert index.with_question_and_answer("home", "das haus") == [home]
+    assert index.with_answer("der wagen") == [car]
+    assert index.with_answer("wagen") == []
+
+
+def test_edits_and_removals():
+    house, car = question("house", "Haus"), question("car", "Wagen")
+    index = QuestionIndex([house, car])
+    index.fill_answers()
+    index.fill_prefixes()
+
+    car.reset_with("car", "Auto")
+    # Until it is updated, the question is skipped rather than found under its old answer
+    assert index.with_answer("wagen") == []
+    index.update(car)
+    assert index.with_answer("auto") == [car]
+    assert index.count_answers_with_prefix("au") == 1
+    assert index.count_answers_with_prefix("wa") == 0
+
+    index.remove(house)
+    assert house not in index
+    assert len(index) == 1
+    assert index.with_answer("haus") == []
+    assert index.near_answer("haus", 1) == []
+
+
+def test_near_answers():
+    house, mouse, hose = question("house", "Haus"), question("mouse", "Maus"), question("trousers", "Hose")
+    index = QuestionIndex([house, mouse])
+    index.fill_answers()
+    # Questions added after the tree was filled are found too
+    index.add(hose)
+
+    assert index.near_answer("haus", 1) == [(0, house), (1, mouse)]
+    assert index.near_answer("hoss", 1) == [(1, hose)]
+    assert index.near_answer("haus", 0) == [(0, house)]
+    assert index.near_answer("hund", 1) == []
@@ -0,0 +1,51 @@
+import random
+
+from collections import Counter
+from math import nextafter
+
+from lib.sampler import WeightedSampler
+
+DRAWS = 40000
+
+
+def frequencies(sampler: WeightedSampler, draws: int = DRAWS) -> dict[int, float]:
+    counts = Counter(sampler.draw() for _ in range(draws))
+    return {index: count / draws for index, count in counts.items()}
+
+
+def test_draws_follow_weights_after_removals():
+    random.seed(1)
+    sampler = WeightedSampler([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    sampler.remove(1)
+    sampler.remove(5)
+    sampler.update(0, 2.0)
+
+    freqs = frequencies(sampler)
+    assert set(freqs) == {0, 2, 3, 4}
+    total = 2.0 + 3.0 + 4.0 + 5.0
+    for index, weight in {0: 2.0, 2: 3.0, 3: 4.0, 4: 5.0}.items():
+        assert abs(freqs[index] - weight / total) < 0.01
+
+
+def test_float_drift_does_not_favor_the_heaviest_entry(monkeypatch):
+    sampler = WeightedSampler([0.0, 0.0, 0.4, 0.2])
+    sampler.update(1, 0.8)
+    sampler.update(2, 0.7)
+    sampler.update(2, 0.3)
+    sampler.remove(3)
+    # Rounding errors left in the tree put the top of its total past the last entry with weight
+    monkeypatch.setattr(random, "random", lambda: nextafter(1.0, 0.0))
+    assert sampler.draw() == 2
+
+    monkeypatch.undo()
+    random.seed(2)
+    freqs = frequencies(sampler)
+    assert set(freqs) == {1, 2}
+    assert abs(freqs[2] - 0.3 / 1.1) < 0.01
+
+
+def test_uniform_when_no_weight_is_left():
+    random.seed(3)
+    sampler = WeightedSampler([0.0, 0.0, 0.0])
+    sampler.remove(0)
+    assert set(frequencies(sampler, 1000)) == {1, 2}
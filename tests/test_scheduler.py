@@ -0,0 +1,89 @@
+import pytest
+
+import lib.scheduler as scheduler
+
+from lib.scheduler import INTERVAL_UNIT, SpacedScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the clock of the scheduler with one that only moves when told to."""
+    now = [1000.0]
+    monkeypatch.setattr(scheduler.time, "monotonic", lambda: now[0])
+    return now
+
+
+def pop_all(sched: SpacedScheduler) -> list[int]:
+    popped = []
+    while True:
+        try:
+            popped.append(sched.pop())
+        except ValueError:
+            return popped
+
+
+def test_pops_by_due_time(clock):
+    # Entries answered more often in a row are due later
+    sched = SpacedScheduler([3, 0, 2, 1])
+    assert pop_all(sched) == [1, 3, 2, 0]
+
+
+def test_intervals_follow_sm2(clock):
+    sched = SpacedScheduler([0])
+    intervals = []
+    for _ in range(4):
+        idx = sched.pop()
+        sched.record(idx, True)
+        intervals.append((sched.due(idx) - clock[0]) / INTERVAL_UNIT)
+    # Each correct answer raises the ease by 0.1 from 2.5, before it is applied to the interval
+    assert intervals == pytest.approx([1.0, 6.0, 6.0 * 2.8, 6.0 * 2.8 * 2.9])
+
+
+def test_correct_answer_postpones(clock):
+    sched = SpacedScheduler([0, 0])
+    first = sched.pop()
+    sched.record(first, True)
+    assert sched.pop() != first
+    assert sched.due(first) == clock[0] + INTERVAL_UNIT
+
+
+def test_incorrect_answer_starts_over(clock):
+    sched = SpacedScheduler([5, 4])
+    idx = sched.pop()
+    assert idx == 1
+    sched.record(idx, False)
+    assert sched.due(idx) == clock[0] + INTERVAL_UNIT
+    # The entry is due again before the one that was answered many times
+    assert pop_all(sched) == [1, 0]
+
+    # And climbs back from the first interval, with a lower ease
+    sched.record(1, True)
+    assert sched.due(1) == clock[0] + INTERVAL_UNIT
+    sched.record(1, True)
+    assert sched.due(1) == clock[0] + 6 * INTERVAL_UNIT
+
+
+def test_checked_out_entries_are_not_popped_until_requeued(clock):
+    sched = SpacedScheduler([0, 1])
+    assert sched.pop() == 0
+    assert sched.pop() == 1
+    with pytest.raises(ValueError):
+        sched.pop()
+
+    sched.requeue(0)
+    sched.requeue(0)
+    assert pop_all(sched) == [0]
+
+
+def test_removed_entries_are_never_popped(clock):
+    sched = SpacedScheduler([0, 1, 2])
+    sched.remove(0)
+    assert len(sched) == 2
+    assert sched.is_removed(0)
+
+    idx = sched.pop()
+    sched.remove(idx)
+    sched.requeue(idx)
+    sched.record(idx, True)
+    assert pop_all(sched) == [2]
+    assert len(sched) == 1
@@ -0,0 +1,137 @@
+import struct
+import zlib
+
+import pytest
+
+import lib.score as score
+
+from lib.score import JOURNAL_MAGIC, MAGIC, ScoreFile, ScoreTable
+
+ROWS = [(0, 0, 0, 0.0), (3, 2, 1, 0.5), (70000, 65000, 12, 0.9), (1, 0, 0, 0.0)]
+
+
+def table_of(rows) -> ScoreTable:
+    table = ScoreTable()
+    for row in rows:
+        table.append_row(*row)
+    return table
+
+
+def rows_of(score_file: ScoreFile) -> list[tuple[int, int, int, float]]:
+    return [s.values() for s in score_file.scores]
+
+
+@pytest.fixture
+def saved(tmp_path) -> ScoreFile:
+    score_file = ScoreFile(tmp_path, "set", table_of(ROWS))
+    score_file.save()
+    return score_file
+
+
+def test_save_and_load(tmp_path, saved):
+    data = (tmp_path / "set.voc_score").read_bytes()
+    magic, version, record_size, count, crc = struct.unpack_from("<4sHHII", data)
+    assert (magic, version, record_size, count) == (MAGIC, 2, 20, len(ROWS))
+    assert zlib.crc32(data[16:]) == crc
+
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == ROWS
+    assert saved.check_saved(verify=True)
+
+
+def test_corrupted_file_is_refused(tmp_path, saved):
+    path = tmp_path / "set.voc_score"
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="Checksum"):
+        ScoreFile.load(tmp_path, "set")
+
+
+def test_upgrade_from_version_0(tmp_path):
+    lines = [struct.pack(">HHH", total, correct, streak) + b"\n" for total, correct, streak in [(4, 1, 0), (0, 0, 0)]]
+    (tmp_path / "set.voc_score").write_bytes(b"0\n" + b"".join(lines))
+
+    score_file = ScoreFile.load(tmp_path, "set")
+    assert rows_of(score_file) == [(4, 1, 0, 0.25), (0, 0, 0, 0.0)]
+    # Older files are not appended to, but rewritten in the current version
+    assert not score_file.record(score_file.scores[0])
+    score_file.compact()
+
+    assert (tmp_path / "set.voc_score").read_bytes().startswith(MAGIC)
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == [(4, 1, 0, 0.25), (0, 0, 0, 0.0)]
+
+
+@pytest.mark.parametrize("separator", [b"", b"\n"])
+def test_upgrade_from_version_1(tmp_path, separator):
+    rows = [(5, 3, 2, 0.375), (65535, 1, 0, 0.0)]
+    records = [struct.pack(">HHH", *row[:3]) + struct.pack("<d", row[3]) + separator for row in rows]
+    (tmp_path / "set.voc_score").write_bytes(b"1\n" + b"".join(records))
+
+    score_file = ScoreFile.load(tmp_path, "set")
+    assert rows_of(score_file) == rows
+    score_file.compact()
+
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == rows
+    assert score_file.check_saved(verify=True)
+
+
+def test_journal_append_compact_reload(tmp_path, saved):
+    journal = tmp_path / "set.voc_score_journal"
+    saved.scores[1].update(True)
+    assert saved.record(saved.scores[1])
+    saved.scores[3].update(False)
+    assert saved.record(saved.scores[3])
+
+    assert journal.read_bytes().startswith(JOURNAL_MAGIC)
+    assert saved.check_saved()
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == rows_of(saved)
+
+    saved.compact()
+    assert not journal.exists()
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == rows_of(saved)
+    assert saved.check_saved(verify=True)
+
+
+def test_journal_is_compacted_past_threshold(tmp_path, saved, monkeypatch):
+    monkeypatch.setattr(score, "JOURNAL_COMPACT_THRESHOLD", 3)
+    for _ in range(3):
+        saved.scores[0].update(True)
+        assert saved.record(saved.scores[0])
+    assert not (tmp_path / "set.voc_score_journal").exists()
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == rows_of(saved)
+
+
+def test_torn_journal_tail(tmp_path, saved):
+    journal = tmp_path / "set.voc_score_journal"
+    saved.scores[1].update(True)
+    saved.record(saved.scores[1])
+    with open(journal, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    # The torn entry is ignored, and dropped by the next append
+    loaded = ScoreFile.load(tmp_path, "set")
+    assert rows_of(loaded) == rows_of(saved)
+    loaded.scores[2].update(False)
+    assert loaded.record(loaded.scores[2])
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == rows_of(loaded)
+
+
+def test_mapped_record_in_place(tmp_path, saved, monkeypatch):
+    monkeypatch.setattr(score, "MAP_SCORE_FILES", True)
+    for idx, correct in [(0, True), (2, False), (2, True)]:
+        saved.scores[idx].update(correct)
+        assert saved.record(saved.scores[idx])
+
+    assert not (tmp_path / "set.voc_score_journal").exists()
+    # The checksum was updated with the records
+    assert saved.check_saved(verify=True)
+    saved.unmap()
+    assert rows_of(ScoreFile.load(tmp_path, "set")) == rows_of(saved)
+
+
+def test_crc_replace():
+    data = bytes(range(256)) * 3
+    for start, new in [(0, b"\xff\x00"), (100, b"abcdefgh"), (len(data) - 4, b"\x00\x00\x00\x00")]:
+        stop = start + len(new)
+        changed = data[:start] + new + data[stop:]
+        assert score._crc_replace(zlib.crc32(data), data[start:stop], new, len(data) - stop) == zlib.crc32(changed)
@@ -0,0 +1,108 @@
+import json
+import random
+
+import lib.normalization as normalization
+
+from lib.normalization import normalize
+from lib.search import SearchHit, SearchIndex
+
+
+class FakeSet:
+    def __init__(self, name: str, rows: list[tuple[str, str]], stamp: int = 1):
+        self.name = name
+        self.rows = rows
+        self.stamp = stamp
+        self.reads = 0
+
+    def content_stamp(self) -> tuple[int, ...] | None:
+        return (self.stamp,)
+
+    def question_pairs(self) -> list[tuple[str, str]]:
+        self.reads += 1
+        return list(self.rows)
+
+
+def naive_search(sets: list[FakeSet], query: str) -> list[SearchHit]:
+    key = normalize(query)
+    return sorted(
+        SearchHit(qset.name, row, question, answer)
+        for qset in sets
+        for row, (question, answer) in enumerate(qset.rows)
+        if key and (key in normalize(question) or key in normalize(answer))
+    )
+
+
+def random_sets(rng: random.Random) -> list[FakeSet]:
+    words = ["Straße", "strasse", "Haus", "Häuser", "la maison", "der Wagen", "fahren", "Bahn", "Bahnhof", "ab"]
+    return [
+        FakeSet(f"set {i}", [(rng.choice(words), rng.choice(words) + " " + rng.choice(words)) for _ in range(20)])
+        for i in range(4)
+    ]
+
+
+def test_search_matches_substring_scan(tmp_path):
+    rng = random.Random(1)
+    sets = random_sets(rng)
+    index = SearchIndex(tmp_path / "index.json")
+    index.refresh(sets)
+
+    for query in ["", "a", "ß", "ss", "HAUS", "häu", "maison", "n b", "bahnhof", "x", "Wagen fahren", "e"]:
+        assert sorted(index.search(query, limit=1000)) == naive_search(sets, query), query
+
+
+def test_search_stops_at_limit(tmp_path):
+    sets = [FakeSet("set", [("Haus", "maison")] * 10)]
+    index = SearchIndex(tmp_path / "index.json")
+    index.refresh(sets)
+    assert len(index.search("haus", limit=3)) == 3
+
+
+def test_persisted_index_is_only_refreshed_for_changed_sets(tmp_path):
+    rng = random.Random(2)
+    sets = random_sets(rng)
+    path = tmp_path / "index.json"
+    index = SearchIndex(path)
+    index.refresh(sets)
+    index.save()
+
+    loaded = SearchIndex.load(path)
+    changed, removed = sets[0], sets[1]
+    changed.rows[3] = ("Flughafen", "l'aéroport")
+    changed.stamp += 1
+    remaining = [qset for qset in sets if qset is not removed]
+    loaded.refresh(remaining)
+
+    assert [qset.reads for qset in sets] == [2, 1, 1, 1]
+    for query in ["flughafen", "haus", "bahn", "ab"]:
+        assert sorted(loaded.search(query, limit=1000)) == naive_search(remaining, query), query
+
+
+def test_index_is_rebuilt_when_normalization_options_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(normalization, "FOLD_SPELLING", True)
+    sets = [FakeSet("set", [("die Straße", "la rue"), ("die Strasse", "la rue")])]
+    path = tmp_path / "index.json"
+    index = SearchIndex(path)
+    index.refresh(sets)
+    index.save()
+    assert len(index.search("straße")) == 2
+
+    monkeypatch.setattr(normalization, "FOLD_SPELLING", False)
+    # An index saved with other options is not loaded
+    loaded = SearchIndex.load(path)
+    assert loaded.search("straße") == []
+    loaded.refresh(sets)
+    assert loaded.search("straße") == naive_search(sets, "straße") == [SearchHit("set", 0, "die Straße", "la rue")]
+
+    # Nor kept if the options change while it is in use
+    monkeypatch.setattr(normalization, "FOLD_SPELLING", True)
+    loaded.refresh(sets)
+    assert len(loaded.search("straße")) == 2
+
+
+def test_unreadable_index_is_empty(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert SearchIndex.load(path).search("haus") == []
+
+    path.write_text(json.dumps({"version": 0}), encoding="utf-8")
+    assert SearchIndex.load(path).search("haus") == []
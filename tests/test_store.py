@@ -0,0 +1,77 @@
+import pytest
+
+import lib.vocabulary as vocabulary
+
+from lib.store import VocabularyStore
+
+from tests.conftest import make_set
+
+ROWS = [("house", "das Haus", 3, 2, 1, 0.5), ("car", "der Wagen", 0, 0, 0, 0.0)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = VocabularyStore(tmp_path / "store.sqlite3")
+    yield store
+    store.close()
+
+
+def test_save_and_load(store):
+    assert store.is_empty()
+    first = store.save_set(None, "first", ROWS)
+    second = store.save_set(None, "empty", [])
+
+    assert not store.is_empty()
+    assert store.load_set(first) == ("first", ROWS)
+    assert store.load_all() == [(first, "first", ROWS), (second, "empty", [])]
+    assert store.load_set(first + second + 1) is None
+
+
+def test_save_replaces_the_set(store):
+    set_id = store.save_set(None, "set", ROWS)
+    assert store.save_set(set_id, "renamed", ROWS[1:]) == set_id
+    assert store.load_set(set_id) == ("renamed", ROWS[1:])
+
+
+def test_update_score(store):
+    set_id = store.save_set(None, "set", ROWS)
+    assert store.update_score(set_id, 1, 1, 1, 1, 0.05)
+    assert store.load_set(set_id) == ("set", [ROWS[0], ("car", "der Wagen", 1, 1, 1, 0.05)])
+    assert not store.update_score(set_id, 2, 1, 1, 1, 0.05)
+
+
+def test_delete(store):
+    kept = store.save_set(None, "kept", ROWS)
+    deleted = store.save_set(None, "deleted", ROWS)
+    store.delete_set(deleted)
+    assert store.load_set(deleted) is None
+    assert store.load_all() == [(kept, "kept", ROWS)]
+
+
+def test_meta(tmp_path, store):
+    assert store.get_meta("key") is None
+    store.set_meta("key", "a")
+    store.set_meta("key", "b")
+    store.close()
+    reopened = VocabularyStore(tmp_path / "store.sqlite3")
+    assert reopened.get_meta("key") == "b"
+    reopened.close()
+
+
+def test_files_are_imported_once(library, monkeypatch):
+    monkeypatch.setattr(vocabulary, "VocabularyStore", lambda: VocabularyStore(library / "store.sqlite3"))
+    make_set("2. second", [("car", "der Wagen")])
+    make_set("10. tenth", [("house", "das Haus"), ("mouse", "die Maus")])
+
+    store = vocabulary.get_store()
+    assert [(name, [row[:2] for row in rows]) for _, name, rows in store.load_all()] == [
+        ("2. second", [("car", "der Wagen")]),
+        ("10. tenth", [("house", "das Haus"), ("mouse", "die Maus")]),
+    ]
+
+    # Sets deleted from the store do not come back from the files when it is opened again
+    for set_id, _, _ in store.load_all():
+        store.delete_set(set_id)
+    store.close()
+    monkeypatch.setattr(vocabulary, "_store", None)
+    assert vocabulary.get_store().is_empty()
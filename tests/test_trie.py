@@ -0,0 +1,36 @@
+import random
+
+from collections import Counter
+
+from lib.trie import PrefixTrie
+
+
+def test_counts_match_linear_scan():
+    rng = random.Random(1)
+    trie = PrefixTrie()
+    strings: Counter[str] = Counter()
+    for _ in range(500):
+        string = "".join(rng.choice("abü ") for _ in range(rng.randint(0, 6)))
+        if strings[string] and rng.random() < 0.4:
+            trie.remove(string)
+            strings[string] -= 1
+        else:
+            trie.add(string)
+            strings[string] += 1
+
+        prefix = string[:rng.randint(0, len(string))]
+        assert trie.count(prefix) == sum(count for s, count in strings.items() if s.startswith(prefix))
+
+    assert len(trie) == strings.total()
+    for prefix in ["", "a", "ab", "b ", "üü", "zzz"]:
+        assert trie.count(prefix) == sum(count for s, count in strings.items() if s.startswith(prefix))
+
+
+def test_removing_everything_empties_the_trie():
+    trie = PrefixTrie()
+    trie.add("haus", 2)
+    trie.add("hand")
+    trie.add("haus", -2)
+    trie.remove("hand")
+    assert len(trie) == 0
+    assert trie.count("h") == 0